@@ -347,7 +347,7 @@ Total Items Extracted: [cyan]{total_extracted}[/cyan]""",
         category_counts = {}
         for result in results:
             for content in result.extracted_contents:
-                cat = content.category.value if hasattr(content.category, 'value') else str(content.category)
+                cat = content.category_str
                 category_counts[cat] = category_counts.get(cat, 0) + 1
         
         table = Table(title="Extracted Content by Category", box=box.SIMPLE)
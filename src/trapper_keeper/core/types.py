@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from pydantic import BaseModel, Field
 
 
@@ -71,6 +71,10 @@ class ExtractionCategory(str, Enum):
     CUSTOM = "🔧 Custom"
 
 
+# Display names of the built-in categories, in declaration order
+CATEGORY_VALUES = tuple(category.value for category in ExtractionCategory)
+
+
 @dataclass
 class Event:
     """Event for component communication."""
@@ -133,6 +137,16 @@ class ExtractedContent:
     tags: Set[str] = field(default_factory=set)
     metadata: Dict[str, Any] = field(default_factory=dict)
     extracted_at: datetime = field(default_factory=datetime.utcnow)
+    category_str: str = field(init=False, repr=False, compare=False)
+    anchor: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Resolve the display name and anchor once instead of on every render
+        if isinstance(self.category, ExtractionCategory):
+            self.category_str = self.category.value
+        else:
+            self.category_str = str(self.category)
+        self.anchor = self.category_str.lower().replace(" ", "-")
 
 
 @dataclass
@@ -148,6 +162,16 @@ class ProcessingResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(frozen=True)
+class ProcessingOverrides:
+    """Per-request settings layered over the shared configuration."""
+    
+    extract_categories: Optional[Tuple[Union[ExtractionCategory, str], ...]] = None
+    min_importance: Optional[float] = None
+    output_dir: Optional[Path] = None
+    output_format: Optional[str] = None
+
+
 class ProcessingConfig(BaseModel):
     """Configuration for document processing."""
     
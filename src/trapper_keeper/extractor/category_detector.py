@@ -1,12 +1,19 @@
 """Category detection for extracted content."""
 
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 from dataclasses import dataclass
 
 from ..core.types import ExtractionCategory
 
 
+@lru_cache(maxsize=256)
+def _compile_ci(regex: str) -> Pattern:
+    """Compile a detection pattern once for case-insensitive matching."""
+    return re.compile(regex, re.IGNORECASE)
+
+
 @dataclass
 class CategoryPattern:
     """Pattern for detecting a category."""
@@ -227,26 +234,7 @@ class CategoryDetector:
         scores: Dict[ExtractionCategory, float] = {}
         
         for pattern in self.patterns:
-            score = 0.0
-            
-            # Check keywords
-            for keyword in pattern.keywords:
-                if keyword in content_lower:
-                    score += 1.0
-                if keyword in title_lower:
-                    score += 2.0  # Title matches are weighted higher
-                    
-            # Check regex patterns
-            for regex in pattern.patterns:
-                matches = len(re.findall(regex, content_lower, re.IGNORECASE))
-                score += matches * 0.5
-                
-                if title and re.search(regex, title_lower, re.IGNORECASE):
-                    score += 3.0  # Strong signal in title
-                    
-            # Apply weight
-            score *= pattern.weight
-            
+            score = self._calculate_pattern_score(content_lower, title_lower, pattern)
             if score > 0:
                 scores[pattern.category] = score
                 
@@ -270,26 +258,7 @@ class CategoryDetector:
         scores: Dict[ExtractionCategory, float] = {}
         
         for pattern in self.patterns:
-            score = 0.0
-            
-            # Check keywords
-            for keyword in pattern.keywords:
-                if keyword in content_lower:
-                    score += 1.0
-                if keyword in title_lower:
-                    score += 2.0
-                    
-            # Check regex patterns
-            for regex in pattern.patterns:
-                matches = len(re.findall(regex, content_lower, re.IGNORECASE))
-                score += matches * 0.5
-                
-                if title and re.search(regex, title_lower, re.IGNORECASE):
-                    score += 3.0
-                    
-            # Apply weight
-            score *= pattern.weight
-            
+            score = self._calculate_pattern_score(content_lower, title_lower, pattern)
             if score > 0:
                 scores[pattern.category] = score
                 
@@ -349,7 +318,7 @@ class CategoryDetector:
         features = {
             "content_length": len(content),
             "word_count": len(content.split()),
-            "line_count": len(content.split('\n')),
+            "line_count": content.count('\n') + 1,
             "has_code": bool(re.search(r'```', content)),
             "has_urls": bool(re.search(r'https?://', content)),
             "has_emails": bool(re.search(r'[\w\.-]+@[\w\.-]+', content)),
@@ -365,9 +334,11 @@ class CategoryDetector:
             features["title_has_numbers"] = bool(re.search(r'\d+', title))
             
         # Pattern matching scores
+        content_lower = content.lower()
+        title_lower = title.lower() if title else ""
         pattern_scores = {}
         for pattern in self.patterns:
-            score = self._calculate_pattern_score(content.lower(), title.lower() if title else "", pattern)
+            score = self._calculate_pattern_score(content_lower, title_lower, pattern)
             if score > 0:
                 pattern_scores[pattern.category.value] = score
                 
@@ -375,7 +346,6 @@ class CategoryDetector:
         
         # Keyword density
         keyword_density = {}
-        content_lower = content.lower()
         for pattern in self.patterns:
             keyword_count = sum(1 for keyword in pattern.keywords if keyword in content_lower)
             if keyword_count > 0:
@@ -386,7 +356,10 @@ class CategoryDetector:
         return features
         
     def _calculate_pattern_score(self, content: str, title: str, pattern: CategoryPattern) -> float:
-        """Calculate score for a single pattern."""
+        """Calculate score for a single pattern.
+        
+        ``content`` and ``title`` must already be lowercased.
+        """
         score = 0.0
         
         # Check keywords
@@ -394,15 +367,15 @@ class CategoryDetector:
             if keyword in content:
                 score += 1.0
             if keyword in title:
-                score += 2.0
+                score += 2.0  # Title matches are weighted higher
                 
         # Check regex patterns
         for regex in pattern.patterns:
-            matches = len(re.findall(regex, content, re.IGNORECASE))
-            score += matches * 0.5
+            compiled = _compile_ci(regex)
+            score += len(compiled.findall(content)) * 0.5
             
-            if title and re.search(regex, title, re.IGNORECASE):
-                score += 3.0
+            if title and compiled.search(title):
+                score += 3.0  # Strong signal in title
                 
         return score * pattern.weight
         
@@ -468,7 +441,8 @@ class CategoryDetector:
                 matched_patterns = []
                 
                 for regex in pattern.patterns:
-                    if re.search(regex, content_lower, re.IGNORECASE) or (title and re.search(regex, title_lower, re.IGNORECASE)):
+                    compiled = _compile_ci(regex)
+                    if compiled.search(content_lower) or (title and compiled.search(title_lower)):
                         matched_patterns.append(regex)
                         
                 explanation_parts = []
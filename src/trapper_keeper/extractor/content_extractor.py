@@ -8,11 +8,13 @@ import structlog
 
 from ..core.base import Extractor, EventBus
 from ..core.types import (
+    CATEGORY_VALUES,
     Document,
     DocumentSection,
     ExtractedContent,
     ExtractionCategory,
     ProcessingConfig,
+    ProcessingOverrides,
     EventType
 )
 from .category_detector import CategoryDetector
@@ -46,10 +48,23 @@ class ContentExtractor(Extractor):
         """Stop the extractor."""
         pass
 
-    async def extract(self, document: Document) -> List[ExtractedContent]:
+    async def extract(
+        self,
+        document: Document,
+        overrides: Optional[ProcessingOverrides] = None
+    ) -> List[ExtractedContent]:
         """Extract content from a document."""
         self._logger.info("extracting_content", doc_id=document.id)
 
+        # Request-level overrides take precedence over the shared config
+        categories = self.config.extract_categories
+        min_importance = self.config.min_importance
+        if overrides:
+            if overrides.extract_categories:
+                categories = overrides.extract_categories
+            if overrides.min_importance is not None:
+                min_importance = overrides.min_importance
+
         await self.publish_event(
             EventType.EXTRACTION_STARTED,
             {"document_id": document.id}
@@ -58,9 +73,12 @@ class ContentExtractor(Extractor):
         extracted_contents = []
 
         try:
-            # Extract from document sections
+            # Walk the section tree once from its roots; document.sections also
+            # lists every child, which _extract_from_section already visits
             for section in document.sections:
-                contents = await self._extract_from_section(document, section)
+                if section.parent_id is not None:
+                    continue
+                contents = await self._extract_from_section(document, section, categories)
                 extracted_contents.extend(contents)
 
             # Extract code blocks if enabled
@@ -76,7 +94,7 @@ class ContentExtractor(Extractor):
             # Filter by importance
             extracted_contents = [
                 content for content in extracted_contents
-                if content.importance >= self.config.min_importance
+                if content.importance >= min_importance
             ]
 
             self._logger.info(
@@ -114,12 +132,13 @@ class ContentExtractor(Extractor):
 
     def get_supported_categories(self) -> List[str]:
         """Get list of supported extraction categories."""
-        return [cat.value for cat in ExtractionCategory]
+        return list(CATEGORY_VALUES)
 
     async def _extract_from_section(
         self,
         document: Document,
-        section: DocumentSection
+        section: DocumentSection,
+        categories: Optional[List] = None
     ) -> List[ExtractedContent]:
         """Extract content from a document section."""
         contents = []
@@ -135,7 +154,7 @@ class ContentExtractor(Extractor):
         )
 
         # Check if category is in our extraction list
-        if self._should_extract_category(category):
+        if self._should_extract_category(category, categories):
             # Calculate importance based on various factors
             importance = self._calculate_importance(
                 section,
@@ -165,7 +184,7 @@ class ContentExtractor(Extractor):
 
         # Process child sections
         for child in section.children:
-            child_contents = await self._extract_from_section(document, child)
+            child_contents = await self._extract_from_section(document, child, categories)
             contents.extend(child_contents)
 
         return contents
@@ -203,7 +222,7 @@ class ContentExtractor(Extractor):
                 tags={block["language"], "code"},
                 metadata={
                     "language": block["language"],
-                    "line_count": len(block["code"].split('\n')),
+                    "line_count": block["code"].count('\n') + 1,
                     "char_count": len(block["code"]),
                 }
             )
@@ -262,12 +281,18 @@ class ContentExtractor(Extractor):
 
         return contents
 
-    def _should_extract_category(self, category: ExtractionCategory) -> bool:
+    def _should_extract_category(
+        self,
+        category: ExtractionCategory,
+        categories: Optional[List] = None
+    ) -> bool:
         """Check if a category should be extracted."""
-        if not self.config.extract_categories:
+        if categories is None:
+            categories = self.config.extract_categories
+        if not categories:
             return True
 
-        return category in self.config.extract_categories or category.value in self.config.extract_categories
+        return category in categories or category.value in categories
 
     def _calculate_importance(
         self,
@@ -640,8 +665,8 @@ class ContentExtractor(Extractor):
             tags=self._extract_tags(target_section),
             metadata={
                 "has_context": True,
-                "context_before_lines": len(context_before.split('\n')) if context_before else 0,
-                "context_after_lines": len(context_after.split('\n')) if context_after else 0,
+                "context_before_lines": context_before.count('\n') + 1 if context_before else 0,
+                "context_after_lines": context_after.count('\n') + 1 if context_after else 0,
                 "confidence": confidence,
             }
         )
@@ -685,13 +710,15 @@ class ContentExtractor(Extractor):
     async def extract_from_sections(
         self,
         document: Document,
-        sections: List[DocumentSection]
+        sections: List[DocumentSection],
+        overrides: Optional[ProcessingOverrides] = None
     ) -> List[ExtractedContent]:
         """Extract content from specific sections."""
         extracted_contents = []
+        categories = overrides.extract_categories if overrides else None
 
         for section in sections:
-            contents = await self._extract_from_section(document, section)
+            contents = await self._extract_from_section(document, section, categories)
             extracted_contents.extend(contents)
 
         return extracted_contents
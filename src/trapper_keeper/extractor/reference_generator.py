@@ -83,7 +83,7 @@ class ReferenceGenerator:
             references["source"] = source_link
             
         # Category reference
-        category_link = f"[[{content.category}]]"
+        category_link = f"[[{content.category_str}]]"
         references["category"] = category_link
         
         # Tag references
@@ -138,17 +138,28 @@ class ReferenceGenerator:
         if not source_path.exists():
             return ""
             
-        content = source_path.read_text(encoding='utf-8')
+        source_content = source_path.read_text(encoding='utf-8')
         
         # Find insertion point (after frontmatter if exists)
-        lines = content.split('\n')
-        insert_index = 0
+        insert_pos = 0
+        append = False
         
-        # Skip frontmatter
-        if lines and lines[0].strip() == '---':
-            for i, line in enumerate(lines[1:], 1):
+        # Skip frontmatter; fence lines are compared after strip(), so CRLF
+        # endings and trailing spaces still count, but only the frontmatter
+        # lines are visited rather than splitting the whole file
+        line_end = source_content.find('\n')
+        first_line = source_content if line_end == -1 else source_content[:line_end]
+        if first_line.strip() == '---':
+            while line_end != -1:
+                line_start = line_end + 1
+                line_end = source_content.find('\n', line_start)
+                line = source_content[line_start:] if line_end == -1 else source_content[line_start:line_end]
                 if line.strip() == '---':
-                    insert_index = i + 1
+                    if line_end == -1:
+                        # Closing fence is the last line, so links follow it
+                        append = True
+                    else:
+                        insert_pos = line_end + 1
                     break
                     
         # Build extraction links section
@@ -157,7 +168,7 @@ class ReferenceGenerator:
         # Group by category
         by_category: Dict[str, List[Tuple[ExtractedContent, Path]]] = {}
         for content, path in extractions:
-            category = str(content.category)
+            category = content.category_str
             if category not in by_category:
                 by_category[category] = []
             by_category[category].append((content, path))
@@ -185,9 +196,11 @@ class ReferenceGenerator:
             link_section.append("")
             
         # Insert links into content
-        lines[insert_index:insert_index] = link_section
-        
-        return '\n'.join(lines)
+        links = '\n'.join(link_section)
+        if append:
+            return source_content + '\n' + links
+            
+        return source_content[:insert_pos] + links + '\n' + source_content[insert_pos:]
         
     def generate_index_file(
         self,
@@ -207,8 +220,10 @@ class ReferenceGenerator:
         
         # Group by category
         by_category: Dict[str, List[Tuple[ExtractedContent, Path]]] = {}
+        anchors: Dict[str, str] = {}
         for content, path in contents:
-            category = str(content.category)
+            category = content.category_str
+            anchors[category] = content.anchor
             if category not in by_category:
                 by_category[category] = []
             by_category[category].append((content, path))
@@ -217,7 +232,7 @@ class ReferenceGenerator:
         lines.extend(["## Table of Contents", ""])
         for category in sorted(by_category.keys()):
             count = len(by_category[category])
-            lines.append(f"- [{category}](#{category.lower().replace(' ', '-')}) ({count} items)")
+            lines.append(f"- [{category}](#{anchors[category]}) ({count} items)")
             
         lines.extend(["", "---", ""])
         
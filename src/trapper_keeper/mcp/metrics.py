@@ -1,10 +1,11 @@
 """Metrics and monitoring for MCP server."""
 
+import threading
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter
 import structlog
 
 logger = structlog.get_logger()
@@ -22,10 +23,14 @@ class ToolMetrics:
     min_duration: Optional[float] = None
     max_duration: Optional[float] = None
     last_call_time: Optional[datetime] = None
-    error_counts: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    error_counts: Counter = field(default_factory=Counter)
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _cached_version: int = field(default=-1, init=False, repr=False, compare=False)
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def record_call(self, success: bool, duration: float, error: Optional[str] = None):
         """Record a tool call."""
+        self._version += 1
         self.total_calls += 1
         self.total_duration += duration
         self.last_call_time = datetime.utcnow()
@@ -58,7 +63,17 @@ class ToolMetrics:
         return (self.successful_calls / self.total_calls) * 100
         
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for reporting."""
+        """Convert to dictionary for reporting.
+        
+        The formatted view is cached until the next recorded call.
+        """
+        if self._cached_dict is None or self._cached_version != self._version:
+            self._cached_dict = self._build_dict()
+            self._cached_version = self._version
+        return dict(self._cached_dict)
+        
+    def _build_dict(self) -> Dict[str, Any]:
+        """Build the formatted reporting view."""
         return {
             "tool_name": self.tool_name,
             "total_calls": self.total_calls,
@@ -110,6 +125,7 @@ class MCPMetricsCollector:
     def __init__(self):
         self.server_metrics = ServerMetrics()
         self.tool_metrics: Dict[str, ToolMetrics] = {}
+        self._lock = threading.Lock()
         self._logger = logger.bind(component="MCPMetricsCollector")
         
     def record_tool_call(
@@ -120,11 +136,13 @@ class MCPMetricsCollector:
         error: Optional[str] = None
     ):
         """Record a tool call."""
-        if tool_name not in self.tool_metrics:
-            self.tool_metrics[tool_name] = ToolMetrics(tool_name)
-            
-        self.tool_metrics[tool_name].record_call(success, duration, error)
-        self.server_metrics.total_requests += 1
+        with self._lock:
+            metrics = self.tool_metrics.get(tool_name)
+            if metrics is None:
+                metrics = self.tool_metrics[tool_name] = ToolMetrics(tool_name)
+                
+            metrics.record_call(success, duration, error)
+            self.server_metrics.total_requests += 1
         
         self._logger.info(
             "tool_call_recorded",
@@ -140,21 +158,24 @@ class MCPMetricsCollector:
         
     def increment_processed_files(self):
         """Increment processed files counter."""
-        self.server_metrics.processed_files += 1
+        with self._lock:
+            self.server_metrics.processed_files += 1
         
     def add_extracted_contents(self, count: int):
         """Add to extracted contents counter."""
-        self.server_metrics.extracted_contents += count
+        with self._lock:
+            self.server_metrics.extracted_contents += count
         
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get a summary of all metrics."""
-        return {
-            "server": self.server_metrics.to_dict(),
-            "tools": {
-                name: metrics.to_dict()
-                for name, metrics in self.tool_metrics.items()
+        with self._lock:
+            return {
+                "server": self.server_metrics.to_dict(),
+                "tools": {
+                    name: metrics.to_dict()
+                    for name, metrics in self.tool_metrics.items()
+                }
             }
-        }
         
     def get_tool_metrics(self, tool_name: str) -> Optional[ToolMetrics]:
         """Get metrics for a specific tool."""
@@ -162,13 +183,14 @@ class MCPMetricsCollector:
         
     def reset_tool_metrics(self, tool_name: Optional[str] = None):
         """Reset metrics for a tool or all tools."""
-        if tool_name:
-            if tool_name in self.tool_metrics:
-                self.tool_metrics[tool_name] = ToolMetrics(tool_name)
-        else:
-            # Reset all tool metrics
-            for name in list(self.tool_metrics.keys()):
-                self.tool_metrics[name] = ToolMetrics(name)
+        with self._lock:
+            if tool_name:
+                if tool_name in self.tool_metrics:
+                    self.tool_metrics[tool_name] = ToolMetrics(tool_name)
+            else:
+                # Reset all tool metrics
+                for name in list(self.tool_metrics.keys()):
+                    self.tool_metrics[name] = ToolMetrics(name)
                 
         self._logger.info("metrics_reset", tool=tool_name or "all")
 
@@ -210,36 +232,37 @@ class MetricsContext:
         self.error = error
 
 
-def format_metrics_report(metrics: Dict[str, Any]) -> str:
-    """Format metrics as a human-readable report."""
-    lines = [
-        "=== Trapper Keeper MCP Server Metrics ===",
-        "",
-        "Server Status:",
-        f"  Uptime: {metrics['server']['uptime']}",
-        f"  Total Requests: {metrics['server']['total_requests']}",
-        f"  Requests/min: {metrics['server']['requests_per_minute']:.2f}",
-        f"  Active Watchers: {metrics['server']['active_watchers']}",
-        f"  Processed Files: {metrics['server']['processed_files']}",
-        f"  Extracted Contents: {metrics['server']['extracted_contents']}",
-        "",
-        "Tool Performance:",
-    ]
+def _iter_report_lines(metrics: Dict[str, Any]) -> Iterator[str]:
+    """Yield the lines of a human-readable metrics report."""
+    server = metrics['server']
+    
+    yield "=== Trapper Keeper MCP Server Metrics ==="
+    yield ""
+    yield "Server Status:"
+    yield f"  Uptime: {server['uptime']}"
+    yield f"  Total Requests: {server['total_requests']}"
+    yield f"  Requests/min: {server['requests_per_minute']:.2f}"
+    yield f"  Active Watchers: {server['active_watchers']}"
+    yield f"  Processed Files: {server['processed_files']}"
+    yield f"  Extracted Contents: {server['extracted_contents']}"
+    yield ""
+    yield "Tool Performance:"
     
     for tool_name, tool_data in metrics['tools'].items():
-        lines.extend([
-            f"  {tool_name}:",
-            f"    Total Calls: {tool_data['total_calls']}",
-            f"    Success Rate: {tool_data['success_rate']}",
-            f"    Avg Duration: {tool_data['average_duration']}",
-            f"    Min/Max: {tool_data['min_duration']} / {tool_data['max_duration']}",
-        ])
+        yield f"  {tool_name}:"
+        yield f"    Total Calls: {tool_data['total_calls']}"
+        yield f"    Success Rate: {tool_data['success_rate']}"
+        yield f"    Avg Duration: {tool_data['average_duration']}"
+        yield f"    Min/Max: {tool_data['min_duration']} / {tool_data['max_duration']}"
         
         if tool_data['top_errors']:
-            lines.append("    Top Errors:")
+            yield "    Top Errors:"
             for error, count in tool_data['top_errors'].items():
-                lines.append(f"      - {error}: {count}")
+                yield f"      - {error}: {count}"
                 
-        lines.append("")
-        
-    return "\n".join(lines)
\ No newline at end of file
+        yield ""
+
+
+def format_metrics_report(metrics: Dict[str, Any]) -> str:
+    """Format metrics as a human-readable report."""
+    return "\n".join(_iter_report_lines(metrics))
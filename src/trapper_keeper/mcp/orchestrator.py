@@ -1,14 +1,20 @@
 """Processing orchestrator for coordinating document processing pipeline."""
 
 import asyncio
+import os
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+import aiofiles
 import structlog
 
 from ..core.base import Component, EventBus
 from ..core.types import (
     Document,
+    ProcessingOverrides,
     ProcessingResult,
     TrapperKeeperConfig,
     EventType,
@@ -16,9 +22,45 @@ from ..core.types import (
 from ..parser import get_parser
 from ..extractor import ContentExtractor
 from ..organizer import DocumentOrganizer
+from ..utils.files import iter_matching_files
 
 logger = structlog.get_logger()
 
+# Maximum number of processing results kept in the orchestrator cache
+RESULT_CACHE_SIZE = 512
+
+# Per-process state for pool workers, keyed by serialized config
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_orchestrators: Dict[str, "ProcessingOrchestrator"] = {}
+
+
+def _process_file_job(
+    path: Path,
+    config_json: str,
+    overrides: Optional[ProcessingOverrides] = None
+) -> ProcessingResult:
+    """Process a single file inside a pool worker process.
+
+    Each worker keeps one event loop and one initialized orchestrator per
+    configuration, so only the first job pays the setup cost. Results are
+    cached by the parent process, not here.
+    """
+    global _worker_loop
+    if _worker_loop is None:
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+
+    orchestrator = _worker_orchestrators.get(config_json)
+    if orchestrator is None:
+        config = TrapperKeeperConfig.model_validate_json(config_json)
+        orchestrator = ProcessingOrchestrator(config)
+        _worker_loop.run_until_complete(orchestrator.initialize())
+        _worker_orchestrators[config_json] = orchestrator
+
+    return _worker_loop.run_until_complete(
+        orchestrator._run_pipeline(path, overrides)
+    )
+
 
 class ProcessingOrchestrator(Component):
     """Orchestrates the document processing pipeline."""
@@ -29,6 +71,10 @@ class ProcessingOrchestrator(Component):
         self.extractor: Optional[ContentExtractor] = None
         self.organizer: Optional[DocumentOrganizer] = None
         self._processing_semaphore: Optional[asyncio.Semaphore] = None
+        # (path, overrides) -> (mtime_ns, size, result), least recently used first
+        self._result_cache: OrderedDict = OrderedDict()
+        # Worker processes for process_file_in_pool, created on first use
+        self._proc_pool: Optional[ProcessPoolExecutor] = None
         
     async def _initialize(self) -> None:
         """Initialize the orchestrator."""
@@ -71,6 +117,8 @@ class ProcessingOrchestrator(Component):
         if self.organizer:
             await self.organizer.stop()
             
+        self.close_process_pool()
+        
     async def _process_events(self) -> None:
         """Process events from the event queue."""
         while True:
@@ -95,10 +143,104 @@ class ProcessingOrchestrator(Component):
             except Exception as e:
                 self._logger.error("error_processing_file", path=str(path), error=str(e))
                 
-    async def process_file(self, path: Path) -> ProcessingResult:
-        """Process a single file through the pipeline."""
+    async def _file_signature(self, path: Path) -> Optional[Tuple[int, int]]:
+        """Return the (mtime_ns, size) of a file, or None if it can't be read."""
+        loop = asyncio.get_running_loop()
+        try:
+            st = await loop.run_in_executor(None, path.stat)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+        
+    def _get_cached_result(
+        self,
+        key: Tuple[str, Optional[ProcessingOverrides]],
+        signature: Optional[Tuple[int, int]]
+    ) -> Optional[ProcessingResult]:
+        """Return the cached result for an unchanged file."""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        if signature is None or entry[:2] != signature:
+            # File changed or disappeared since it was cached
+            del self._result_cache[key]
+            return None
+            
+        self._result_cache.move_to_end(key)
+        return entry[2]
+        
+    def _cache_result(
+        self,
+        key: Tuple[str, Optional[ProcessingOverrides]],
+        signature: Optional[Tuple[int, int]],
+        result: ProcessingResult
+    ) -> None:
+        """Cache a successful result under the file's signature."""
+        if signature is None or not result.success:
+            return
+            
+        self._result_cache[key] = (signature[0], signature[1], result)
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+            
+    def clear_cache(self) -> None:
+        """Drop all cached processing results."""
+        self._result_cache.clear()
+        
+    def close_process_pool(self) -> None:
+        """Shut down the worker process pool, if one was started."""
+        if self._proc_pool is not None:
+            self._proc_pool.shutdown(wait=True)
+            self._proc_pool = None
+            
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Return the worker process pool, starting it on first use.
+        
+        Workers are only forked once pool processing is requested, not when
+        the server starts.
+        """
+        if self._proc_pool is None:
+            self._proc_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._proc_pool
+        
+    async def process_file(
+        self,
+        path: Path,
+        *,
+        overrides: Optional[ProcessingOverrides] = None
+    ) -> ProcessingResult:
+        """Process a single file through the pipeline.
+        
+        Overrides apply to this call only and leave the shared config untouched.
+        Files whose mtime and size are unchanged reuse the cached extraction;
+        their output is still saved and the completion event still published.
+        """
+        path_str = os.fspath(path)
+        key = (path_str, overrides)
+        signature = await self._file_signature(path)
+        cached = self._get_cached_result(key, signature)
+        if cached is not None:
+            self._logger.debug("file_result_cached", path=path_str)
+            
+        result = await self._run_pipeline(path, overrides, cached)
+        self._cache_result(key, signature, result)
+        return result
+        
+    async def _run_pipeline(
+        self,
+        path: Path,
+        overrides: Optional[ProcessingOverrides],
+        cached: Optional[ProcessingResult] = None
+    ) -> ProcessingResult:
+        """Parse, extract and save a single file.
+        
+        With ``cached``, its extracted contents are reused and only the
+        save and the completion event run.
+        """
         start_time = time.time()
-        self._logger.info("processing_file", path=str(path))
+        path_str = os.fspath(path)
+        self._logger.info("processing_file", path=path_str)
         
         result = ProcessingResult(
             document_id="",
@@ -106,37 +248,52 @@ class ProcessingOrchestrator(Component):
         )
         
         try:
-            # Get parser
-            parser = get_parser(path, self.event_bus)
-            if not parser:
-                result.errors.append(f"No parser available for {path}")
-                return result
+            if cached is not None:
+                document_id = cached.document_id
+                extracted_contents = cached.extracted_contents
+            else:
+                # Get parser
+                parser = get_parser(path, self.event_bus)
+                if not parser:
+                    result.errors.append(f"No parser available for {path}")
+                    return result
+                    
+                # Parse document
+                await parser.initialize()
+                
+                # Read off the event loop so slow disks don't stall other requests
+                async with aiofiles.open(path, 'r', encoding='utf-8') as f:
+                    content = await f.read()
+                document = await parser.parse(content, path)
+                document_id = document.id
                 
-            # Parse document
-            await parser.initialize()
-            content = path.read_text(encoding='utf-8')
-            document = await parser.parse(content, path)
-            result.document_id = document.id
-            
-            # Extract content
-            extracted_contents = await self.extractor.extract(document)
+                # Extract content
+                extracted_contents = await self.extractor.extract(document, overrides)
+                
+            result.document_id = document_id
             result.extracted_contents = extracted_contents
             
             # Organize and save if configured
-            if extracted_contents and self.config.organization.output_dir:
+            output_dir = self.config.organization.output_dir
+            output_format = None
+            if overrides:
+                output_dir = overrides.output_dir or output_dir
+                output_format = overrides.output_format
+                
+            if extracted_contents and output_dir:
                 organized = await self.organizer.organize(extracted_contents)
                 
                 # Create document-specific output dir
-                doc_output_dir = self.config.organization.output_dir / document.id
-                await self.organizer.save(organized, doc_output_dir)
+                doc_output_dir = output_dir / document_id
+                await self.organizer.save(organized, doc_output_dir, output_format)
                 
             result.success = True
             result.processing_time = time.time() - start_time
             
             self._logger.info(
                 "file_processed",
-                path=str(path),
-                document_id=document.id,
+                path=path_str,
+                document_id=document_id,
                 extracted_count=len(extracted_contents),
                 processing_time=result.processing_time
             )
@@ -145,8 +302,8 @@ class ProcessingOrchestrator(Component):
             await self.publish_event(
                 EventType.PROCESSING_COMPLETED,
                 {
-                    "path": str(path),
-                    "document_id": document.id,
+                    "path": path_str,
+                    "document_id": document_id,
                     "extracted_count": len(extracted_contents),
                     "processing_time": result.processing_time
                 }
@@ -158,7 +315,7 @@ class ProcessingOrchestrator(Component):
             
             self._logger.error(
                 "file_processing_failed",
-                path=str(path),
+                path=path_str,
                 error=str(e)
             )
             
@@ -166,13 +323,93 @@ class ProcessingOrchestrator(Component):
             await self.publish_event(
                 EventType.PROCESSING_FAILED,
                 {
-                    "path": str(path),
+                    "path": path_str,
                     "error": str(e)
                 }
             )
             
         return result
         
+    async def process_file_in_pool(
+        self,
+        path: Path,
+        *,
+        overrides: Optional[ProcessingOverrides] = None,
+        config_json: Optional[str] = None
+    ) -> ProcessingResult:
+        """Process a single file in a worker process of the orchestrator's pool.
+
+        Parsing and extraction are CPU bound, so running them in a process
+        pool lets several files make progress at once despite the GIL.
+        Callers processing many files pass ``config_json`` from
+        ``self.config.model_dump_json()`` so the config is serialized once.
+        If the pool itself fails the job, e.g. a worker process is killed,
+        the file gets a failed result and a broken pool is replaced for
+        later files. Unchanged files reuse the cached
+        extraction and are saved here, without a pool job.
+        """
+        path_str = os.fspath(path)
+        key = (path_str, overrides)
+        signature = await self._file_signature(path)
+        cached = self._get_cached_result(key, signature)
+        if cached is not None:
+            self._logger.debug("file_result_cached", path=path_str)
+            return await self._run_pipeline(path, overrides, cached)
+            
+        if config_json is None:
+            config_json = self.config.model_dump_json()
+            
+        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        pool = self._get_process_pool()
+        try:
+            result = await loop.run_in_executor(
+                pool, _process_file_job, path, config_json, overrides
+            )
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool) and self._proc_pool is pool:
+                # A dead worker leaves the pool rejecting every later job;
+                # concurrent failures from the same pool replace it only once
+                self._logger.warning("process_pool_broken", error=str(e))
+                self._proc_pool = None
+                pool.shutdown(wait=False)
+                
+            # Pickling errors and the like also fail only this file
+            self._logger.error(
+                "file_processing_failed",
+                path=path_str,
+                error=str(e)
+            )
+            result = ProcessingResult(
+                document_id="",
+                success=False,
+                errors=[str(e) or type(e).__name__],
+                processing_time=time.time() - start_time
+            )
+        self._cache_result(key, signature, result)
+        
+        # Worker events stay in the worker process, so publish them here
+        if result.success:
+            await self.publish_event(
+                EventType.PROCESSING_COMPLETED,
+                {
+                    "path": path_str,
+                    "document_id": result.document_id,
+                    "extracted_count": len(result.extracted_contents),
+                    "processing_time": result.processing_time
+                }
+            )
+        else:
+            await self.publish_event(
+                EventType.PROCESSING_FAILED,
+                {
+                    "path": path_str,
+                    "error": result.errors[0] if result.errors else "Processing failed"
+                }
+            )
+            
+        return result
+        
     async def process_files(self, paths: List[Path]) -> List[ProcessingResult]:
         """Process multiple files concurrently."""
         tasks = [self.process_file(path) for path in paths]
@@ -190,16 +427,7 @@ class ProcessingOrchestrator(Component):
             return []
             
         patterns = patterns or ["*.md", "*.txt"]
-        files = []
-        
-        for pattern in patterns:
-            if recursive:
-                files.extend(directory.rglob(pattern))
-            else:
-                files.extend(directory.glob(pattern))
-                
-        # Filter to only files
-        files = [f for f in files if f.is_file()]
+        files = list(iter_matching_files(directory, patterns, recursive))
         
         self._logger.info(
             "processing_directory",
@@ -1,20 +1,24 @@
 """FastMCP server implementation for Trapper Keeper."""
 
 import asyncio
+import concurrent.futures
+import os
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
-from datetime import datetime
 import structlog
 
 from fastmcp import FastMCP
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 from ..core.base import EventBus
 from ..core.config import get_config, get_config_manager
 from ..core.types import (
+    CATEGORY_VALUES,
     TrapperKeeperConfig,
     WatchConfig,
     ProcessingConfig,
+    ProcessingOverrides,
     OrganizationConfig,
     ExtractedContent,
     ProcessingResult,
@@ -23,6 +27,7 @@ from ..monitoring import DirectoryWatcher
 from ..parser import get_parser
 from ..extractor import ContentExtractor
 from ..organizer import DocumentOrganizer
+from ..utils.files import iter_matching_files
 from .orchestrator import ProcessingOrchestrator
 from .tools import (
     OrganizeDocumentationTool,
@@ -31,6 +36,11 @@ from .tools import (
     ValidateStructureTool,
     AnalyzeDocumentTool,
 )
+from .tools.organize import OrganizeDocumentationRequest
+from .tools.extract import ExtractContentRequest
+from .tools.reference import CreateReferenceRequest
+from .tools.validate import ValidateStructureRequest
+from .tools.analyze import AnalyzeDocumentRequest
 from .metrics import MCPMetricsCollector, MetricsContext, format_metrics_report
 
 logger = structlog.get_logger()
@@ -38,6 +48,9 @@ logger = structlog.get_logger()
 # FastMCP server instance
 mcp = FastMCP("trapper-keeper")
 
+# Seconds a blocked directory walk waits between checks for cancellation
+ENQUEUE_POLL_INTERVAL = 0.1
+
 
 # Request/Response models for MCP
 class ProcessFileRequest(BaseModel):
@@ -45,6 +58,7 @@ class ProcessFileRequest(BaseModel):
     file_path: str = Field(..., description="Path to the file to process")
     extract_categories: Optional[List[str]] = Field(None, description="Categories to extract")
     output_format: str = Field("markdown", description="Output format (markdown, json, yaml)")
+    include_contents: bool = Field(False, description="Include extracted content in the response")
 
 
 class ProcessDirectoryRequest(BaseModel):
@@ -55,6 +69,7 @@ class ProcessDirectoryRequest(BaseModel):
     extract_categories: Optional[List[str]] = Field(None, description="Categories to extract")
     output_dir: Optional[str] = Field(None, description="Output directory path")
     output_format: str = Field("markdown", description="Output format (markdown, json, yaml)")
+    include_contents: bool = Field(False, description="Include extracted content in each file's result")
 
 
 class WatchDirectoryRequest(BaseModel):
@@ -88,13 +103,55 @@ class ProcessingResultResponse(BaseModel):
     contents: List[ExtractedContentResponse]
 
 
+def _to_content_response(content: ExtractedContent) -> ExtractedContentResponse:
+    """Convert extracted content into its response model.
+
+    The values come from our own dataclass, so pydantic validation is skipped.
+    """
+    return ExtractedContentResponse.model_construct(
+        content_id=content.id,
+        document_id=content.document_id,
+        category=content.category_str,
+        title=content.title,
+        content=content.content,
+        importance=content.importance,
+        tags=list(content.tags),
+        extracted_at=content.extracted_at.isoformat()
+    )
+
+
+def _error_response(error: Exception) -> Dict[str, Any]:
+    """Build the failure payload for an expected tool error.
+
+    Invalid arguments are reported in the response rather than raised, so
+    they don't pay for traceback handling in the MCP layer.
+    """
+    return {"success": False, "errors": [str(error)]}
+
+
 class TrapperKeeperMCP:
     """Main MCP server for Trapper Keeper."""
 
+    __slots__ = (
+        "config",
+        "event_bus",
+        "orchestrator",
+        "organizer",
+        "watchers",
+        "_logger",
+        "organize_tool",
+        "extract_tool",
+        "reference_tool",
+        "validate_tool",
+        "analyze_tool",
+        "metrics",
+    )
+
     def __init__(self, config: Optional[TrapperKeeperConfig] = None):
         self.config = config or get_config()
         self.event_bus = EventBus()
         self.orchestrator: Optional[ProcessingOrchestrator] = None
+        self.organizer = DocumentOrganizer(self.config.organization, self.event_bus)
         self.watchers: Dict[str, DirectoryWatcher] = {}
         self._logger = logger.bind(component="TrapperKeeperMCP")
 
@@ -118,6 +175,7 @@ class TrapperKeeperMCP:
             event_bus=self.event_bus
         )
         await self.orchestrator.initialize()
+        await self.organizer.initialize()
 
         # Initialize tools
         await self.organize_tool.initialize()
@@ -135,23 +193,35 @@ class TrapperKeeperMCP:
         for watcher in self.watchers.values():
             await watcher.stop()
 
-        # Stop orchestrator
+        # Stop orchestrator and its worker processes
         if self.orchestrator:
             await self.orchestrator.stop()
+            self.orchestrator.close_process_pool()
 
         self._logger.info("mcp_server_shutdown")
 
 
 # Global server instance
 _server: Optional[TrapperKeeperMCP] = None
+# Created on first use so it binds to the running event loop
+_server_lock: Optional[asyncio.Lock] = None
 
 
 async def get_server() -> TrapperKeeperMCP:
-    """Get or create the server instance."""
-    global _server
+    """Get or create the server instance.
+
+    Concurrent first calls wait on a lock so only one server is created
+    and initialized.
+    """
+    global _server, _server_lock
     if _server is None:
-        _server = TrapperKeeperMCP()
-        await _server.initialize()
+        if _server_lock is None:
+            _server_lock = asyncio.Lock()
+        async with _server_lock:
+            if _server is None:
+                server = TrapperKeeperMCP()
+                await server.initialize()
+                _server = server
     return _server
 
 
@@ -169,49 +239,37 @@ async def process_file(request: ProcessFileRequest) -> ProcessingResultResponse:
     server = await get_server()
 
     with MetricsContext(server.metrics, "process_file") as ctx:
-        try:
-            # Update config if needed
-            if request.extract_categories:
-                server.config.processing.extract_categories = request.extract_categories
-
-            # Process file
-            path = Path(request.file_path)
-            result = await server.orchestrator.process_file(path)
-
-            # Update metrics
-            if result.success:
-                server.metrics.increment_processed_files()
-                server.metrics.add_extracted_contents(len(result.extracted_contents))
-            else:
-                ctx.set_error(result.errors[0] if result.errors else "Processing failed")
-
-            # Convert to response
-            contents = [
-                ExtractedContentResponse(
-                    content_id=content.id,
-                    document_id=content.document_id,
-                    category=content.category.value if hasattr(content.category, 'value') else content.category,
-                    title=content.title,
-                    content=content.content,
-                    importance=content.importance,
-                    tags=list(content.tags),
-                    extracted_at=content.extracted_at.isoformat()
-                )
-                for content in result.extracted_contents
-            ]
-
-            return ProcessingResultResponse(
-                success=result.success,
-                document_id=result.document_id,
-                extracted_count=len(result.extracted_contents),
-                errors=result.errors,
-                warnings=result.warnings,
-                processing_time=result.processing_time,
-                contents=contents
-            )
-        except Exception as e:
-            ctx.set_error(str(e))
-            raise
+        # Request settings apply to this call only
+        overrides = ProcessingOverrides(
+            extract_categories=tuple(request.extract_categories) if request.extract_categories else None,
+            output_format=request.output_format
+        )
+
+        # Process file
+        path = Path(request.file_path)
+        result = await server.orchestrator.process_file(path, overrides=overrides)
+
+        # Update metrics
+        if result.success:
+            server.metrics.increment_processed_files()
+            server.metrics.add_extracted_contents(len(result.extracted_contents))
+        else:
+            ctx.set_error(result.errors[0] if result.errors else "Processing failed")
+
+        # Convert to response; callers opt in to the full content payload
+        contents = []
+        if request.include_contents:
+            contents = [_to_content_response(content) for content in result.extracted_contents]
+
+        return ProcessingResultResponse.model_construct(
+            success=result.success,
+            document_id=result.document_id,
+            extracted_count=len(result.extracted_contents),
+            errors=result.errors,
+            warnings=result.warnings,
+            processing_time=result.processing_time,
+            contents=contents
+        )
 
 
 @mcp.tool()
@@ -226,77 +284,104 @@ async def process_directory(request: ProcessDirectoryRequest) -> Dict[str, Proce
     """
     server = await get_server()
 
-    # Update config
-    if request.extract_categories:
-        server.config.processing.extract_categories = request.extract_categories
-    if request.output_dir:
-        server.config.organization.output_dir = Path(request.output_dir)
-    server.config.organization.format = request.output_format
+    # Request settings apply to this call only, so concurrent calls don't collide
+    overrides = ProcessingOverrides(
+        extract_categories=tuple(request.extract_categories) if request.extract_categories else None,
+        output_dir=Path(request.output_dir) if request.output_dir else None,
+        output_format=request.output_format
+    )
 
-    # Find matching files
+    # Discover files lazily so processing overlaps the directory walk
     directory = Path(request.directory_path)
-    files = []
+    worker_count = max(1, server.config.max_concurrent_processing)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+    loop = asyncio.get_running_loop()
+
+    # Set when processing ends, so a discovery thread blocked on a full
+    # queue gives up instead of waiting for workers that are gone
+    stop = threading.Event()
+
+    def enqueue(item: Optional[Path]) -> None:
+        # Blocks the discovery thread while the queue is full
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while True:
+            try:
+                future.result(timeout=ENQUEUE_POLL_INTERVAL)
+                return
+            except concurrent.futures.TimeoutError:
+                if stop.is_set():
+                    future.cancel()
+                    return
+
+    def discover_files() -> None:
+        try:
+            # Single walk for all patterns, so each file is queued once
+            for file_path in iter_matching_files(directory, request.patterns, request.recursive):
+                if stop.is_set():
+                    break
+                enqueue(file_path)
+        finally:
+            # One sentinel per worker signals the end of discovery
+            for _ in range(worker_count):
+                enqueue(None)
+
+    # Workers receive the config as JSON; serialize it once for the whole walk
+    config_json = server.orchestrator.config.model_dump_json()
+
+    # Contents of successful files are grouped as each file finishes, so
+    # organizing overlaps with processing instead of following it
+    organized: Dict[str, List[ExtractedContent]] = {}
+
+    async def process_one(file_path: Path) -> ProcessingResultResponse:
+        # Parsing and extraction are CPU bound, so they run in the
+        # orchestrator's process pool, started on the first call
+        result = await server.orchestrator.process_file_in_pool(
+            file_path, overrides=overrides, config_json=config_json
+        )
+        if result.success:
+            server.organizer.organize_batch(result.extracted_contents, organized)
+
+        # Convert to response; callers opt in to the full content payload
+        contents = []
+        if request.include_contents:
+            contents = [_to_content_response(content) for content in result.extracted_contents]
+
+        return ProcessingResultResponse.model_construct(
+            success=result.success,
+            document_id=result.document_id,
+            extracted_count=len(result.extracted_contents),
+            errors=result.errors,
+            warnings=result.warnings,
+            processing_time=result.processing_time,
+            contents=contents
+        )
 
-    for pattern in request.patterns:
-        if request.recursive:
-            files.extend(directory.rglob(pattern))
-        else:
-            files.extend(directory.glob(pattern))
-
-    # Process files
-    results = {}
-    for file_path in files:
-        if file_path.is_file():
-            result = await server.orchestrator.process_file(file_path)
-
-            # Convert to response
-            contents = [
-                ExtractedContentResponse(
-                    content_id=content.id,
-                    document_id=content.document_id,
-                    category=content.category.value if hasattr(content.category, 'value') else content.category,
-                    title=content.title,
-                    content=content.content,
-                    importance=content.importance,
-                    tags=list(content.tags),
-                    extracted_at=content.extracted_at.isoformat()
-                )
-                for content in result.extracted_contents
-            ]
-
-            results[str(file_path)] = ProcessingResultResponse(
-                success=result.success,
-                document_id=result.document_id,
-                extracted_count=len(result.extracted_contents),
-                errors=result.errors,
-                warnings=result.warnings,
-                processing_time=result.processing_time,
-                contents=contents
-            )
+    results: Dict[str, ProcessingResultResponse] = {}
 
-    # Save organized content
-    all_contents = []
-    for result in results.values():
-        if result.success:
-            all_contents.extend([
-                ExtractedContent(
-                    id=c.content_id,
-                    document_id=c.document_id,
-                    category=c.category,
-                    title=c.title,
-                    content=c.content,
-                    importance=c.importance,
-                    tags=set(c.tags),
-                    extracted_at=datetime.fromisoformat(c.extracted_at)
-                )
-                for c in result.contents
-            ])
-
-    if all_contents:
-        organizer = DocumentOrganizer(server.config.organization, server.event_bus)
-        await organizer.initialize()
-        organized = await organizer.organize(all_contents)
-        await organizer.save(organized)
+    async def worker() -> None:
+        while True:
+            file_path = await queue.get()
+            if file_path is None:
+                return
+            # Same string the orchestrator uses for its cache key and events
+            results[os.fspath(file_path)] = await process_one(file_path)
+
+    # The directory walk blocks on I/O, so run it in the executor
+    discovery = loop.run_in_executor(None, discover_files)
+    workers = [asyncio.ensure_future(worker()) for _ in range(worker_count)]
+    try:
+        await asyncio.gather(discovery, *workers)
+    finally:
+        # If a worker failed, stop the rest and release the discovery thread
+        stop.set()
+        for task in workers:
+            task.cancel()
+
+    # Save organized content; category files are rewritten whole, so this
+    # waits until every file has been grouped
+    if organized:
+        server.organizer.sort_groups(organized)
+        await server.organizer.save(organized, overrides.output_dir, overrides.output_format)
 
     return results
 
@@ -379,7 +464,7 @@ async def list_watched_directories() -> List[Dict[str, Union[str, int]]]:
     for path, watcher in server.watchers.items():
         watched.append({
             "directory": path,
-            "processed_files": len(watcher.get_processed_files()),
+            "processed_files": watcher.get_processed_count(),
             "queue_size": watcher.get_queue_size()
         })
 
@@ -393,8 +478,7 @@ async def get_categories() -> List[str]:
     Returns:
         List of category names with emojis
     """
-    from ..core.types import ExtractionCategory
-    return [cat.value for cat in ExtractionCategory]
+    return list(CATEGORY_VALUES)
 
 
 @mcp.tool()
@@ -448,8 +532,6 @@ async def organize_documentation(
     Returns:
         Organization results including suggestions and extracted content
     """
-    from .tools.organize import OrganizeDocumentationRequest
-
     server = await get_server()
 
     with MetricsContext(server.metrics, "organize_documentation") as ctx:
@@ -462,21 +544,21 @@ async def organize_documentation(
                 min_importance=min_importance,
                 create_references=create_references
             )
+        except ValidationError as e:
+            ctx.set_error(str(e))
+            return _error_response(e)
 
-            response = await server.organize_tool.execute(request)
+        response = await server.organize_tool.execute(request)
 
-            # Update metrics
-            if response.success and not dry_run:
-                server.metrics.increment_processed_files()
-                server.metrics.add_extracted_contents(response.extracted_count)
+        # Update metrics
+        if response.success and not dry_run:
+            server.metrics.increment_processed_files()
+            server.metrics.add_extracted_contents(response.extracted_count)
 
-            if not response.success:
-                ctx.set_error(response.errors[0] if response.errors else "Unknown error")
+        if not response.success:
+            ctx.set_error(response.errors[0] if response.errors else "Unknown error")
 
-            return response.dict()
-        except Exception as e:
-            ctx.set_error(str(e))
-            raise
+        return response.model_dump()
 
 
 @mcp.tool()
@@ -510,8 +592,6 @@ async def extract_content(
     Returns:
         Extraction results with details of extracted sections
     """
-    from .tools.extract import ExtractContentRequest
-
     server = await get_server()
 
     with MetricsContext(server.metrics, "extract_content") as ctx:
@@ -526,20 +606,20 @@ async def extract_content(
                 dry_run=dry_run,
                 output_dir=output_dir
             )
+        except ValidationError as e:
+            ctx.set_error(str(e))
+            return _error_response(e)
 
-            response = await server.extract_tool.execute(request)
+        response = await server.extract_tool.execute(request)
 
-            # Update metrics
-            if response.success and not dry_run:
-                server.metrics.add_extracted_contents(response.total_extracted)
+        # Update metrics
+        if response.success and not dry_run:
+            server.metrics.add_extracted_contents(response.total_extracted)
 
-            if not response.success:
-                ctx.set_error(response.errors[0] if response.errors else "Unknown error")
+        if not response.success:
+            ctx.set_error(response.errors[0] if response.errors else "Unknown error")
 
-            return response.dict()
-        except Exception as e:
-            ctx.set_error(str(e))
-            raise
+        return response.model_dump()
 
 
 @mcp.tool()
@@ -569,8 +649,6 @@ async def create_reference(
     Returns:
         Details of created references and links
     """
-    from .tools.reference import CreateReferenceRequest
-
     server = await get_server()
 
     with MetricsContext(server.metrics, "create_reference") as ctx:
@@ -583,16 +661,16 @@ async def create_reference(
                 create_backlinks=create_backlinks,
                 update_source=update_source
             )
+        except ValidationError as e:
+            ctx.set_error(str(e))
+            return _error_response(e)
 
-            response = await server.reference_tool.execute(request)
+        response = await server.reference_tool.execute(request)
 
-            if not response.success:
-                ctx.set_error(response.errors[0] if response.errors else "Unknown error")
+        if not response.success:
+            ctx.set_error(response.errors[0] if response.errors else "Unknown error")
 
-            return response.dict()
-        except Exception as e:
-            ctx.set_error(str(e))
-            raise
+        return response.model_dump()
 
 
 @mcp.tool()
@@ -623,8 +701,6 @@ async def validate_structure(
     Returns:
         Validation report with issues found
     """
-    from .tools.validate import ValidateStructureRequest
-
     server = await get_server()
 
     with MetricsContext(server.metrics, "validate_structure") as ctx:
@@ -637,16 +713,16 @@ async def validate_structure(
                 check_structure=check_structure,
                 patterns=patterns or ["*.md", "*.txt"]
             )
+        except ValidationError as e:
+            ctx.set_error(str(e))
+            return _error_response(e)
 
-            response = await server.validate_tool.execute(request)
+        response = await server.validate_tool.execute(request)
 
-            if not response.success:
-                ctx.set_error(response.errors[0] if response.errors else "Unknown error")
+        if not response.success:
+            ctx.set_error(response.errors[0] if response.errors else "Unknown error")
 
-            return response.dict()
-        except Exception as e:
-            ctx.set_error(str(e))
-            raise
+        return response.model_dump()
 
 
 @mcp.tool()
@@ -694,8 +770,6 @@ async def analyze_document(
     Returns:
         Comprehensive analysis with insights and recommendations
     """
-    from .tools.analyze import AnalyzeDocumentRequest
-
     server = await get_server()
 
     with MetricsContext(server.metrics, "analyze_document") as ctx:
@@ -707,16 +781,16 @@ async def analyze_document(
                 include_recommendations=include_recommendations,
                 days_for_growth=days_for_growth
             )
+        except ValidationError as e:
+            ctx.set_error(str(e))
+            return _error_response(e)
 
-            response = await server.analyze_tool.execute(request)
+        response = await server.analyze_tool.execute(request)
 
-            if not response.success:
-                ctx.set_error(response.errors[0] if response.errors else "Unknown error")
+        if not response.success:
+            ctx.set_error(response.errors[0] if response.errors else "Unknown error")
 
-            return response.dict()
-        except Exception as e:
-            ctx.set_error(str(e))
-            raise
+        return response.model_dump()
 
 
 # Main entry point
@@ -744,12 +818,20 @@ def main():
         cache_logger_on_first_use=True,
     )
 
+    # Use uvloop when installed (the "performance" extra); it isn't available on Windows
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
     # Run server
     uvicorn.run(
         mcp,
         host=config.mcp_host,
         port=config.mcp_port,
-        log_level=config.log_level.lower()
+        log_level=config.log_level.lower(),
+        loop=loop
     )
 
 
@@ -1,16 +1,60 @@
 """Analyze document tool for MCP."""
 
+import asyncio
+import heapq
+import re
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime
 from pydantic import BaseModel, Field
-from collections import Counter
+from collections import Counter, OrderedDict
 
 from .base import BaseTool
-from ...parser import get_parser
+from ...parser import get_parser, parse_file_cached
+from ...extractor import CategoryDetector
 from ...core.types import ExtractionCategory
 
+# Fenced code blocks, or links with an optional leading "!" for images
+_MARKDOWN_RE = re.compile(r'(```[\s\S]*?```)|(!)?\[([^\]]*)\]\(([^)]+)\)')
+
+# Keywords marking a section as critical, matched anywhere in any case
+_CRITICAL_RE = re.compile(r'IMPORTANT|CRITICAL|URGENT|REQUIRED', re.IGNORECASE)
+
+
+# Documents with more sections than this are analyzed off the event loop
+OFFLOAD_SECTION_THRESHOLD = 8
+
+# Most analysis results kept per tool for unchanged files
+ANALYSIS_CACHE_SIZE = 64
+
+# Most recommendations returned per analysis, and how they rank
+MAX_RECOMMENDATIONS = 10
+_PRIORITY_SCORES = {"high": 3, "medium": 2, "low": 1}
+
+
+# Shared detector for section categories; it has no custom rules
+_detector = CategoryDetector()
+
+
+def _scan_counts(content: str) -> Tuple[int, int, int, int]:
+    """Count lines, code blocks, links and images in one pass.
+    
+    Images with alt text also count as links. Links inside code blocks
+    are part of the code and are not counted.
+    """
+    code_blocks = links = images = 0
+    for match in _MARKDOWN_RE.finditer(content):
+        if match.group(1):
+            code_blocks += 1
+            continue
+        if match.group(2):
+            images += 1
+        if match.group(3):
+            links += 1
+            
+    return content.count('\n') + 1, code_blocks, links, images
+
 
 class AnalyzeDocumentRequest(BaseModel):
     """Request to analyze a document."""
@@ -81,15 +125,20 @@ class AnalyzeDocumentTool(BaseTool):
     
     def __init__(self, config, event_bus=None):
         super().__init__("analyze_document", config, event_bus)
+        # (path, mtime_ns, size, request flags) -> response, least recently used first
+        self._results: OrderedDict = OrderedDict()
         
     async def execute(self, request: AnalyzeDocumentRequest) -> AnalyzeDocumentResponse:
         """Execute the analyze document tool."""
         start_time = time.time()
         
         try:
-            # Validate file
+            # Validate file and get its metadata off the event loop
             file_path = Path(request.file_path)
-            if not file_path.exists():
+            loop = asyncio.get_running_loop()
+            try:
+                stat = await loop.run_in_executor(None, file_path.stat)
+            except FileNotFoundError:
                 return AnalyzeDocumentResponse(
                     success=False,
                     document_id="",
@@ -99,10 +148,19 @@ class AnalyzeDocumentTool(BaseTool):
                     processing_time=time.time() - start_time
                 )
                 
-            # Get file metadata
-            stat = file_path.stat()
             last_modified = datetime.fromtimestamp(stat.st_mtime).isoformat()
             
+            # Reuse the previous result while the file and options are unchanged
+            cache_key = (
+                request.file_path, stat.st_mtime_ns, stat.st_size,
+                request.include_statistics, request.include_growth,
+                request.include_recommendations, request.days_for_growth,
+            )
+            cached = self._results.get(cache_key)
+            if cached is not None:
+                self._results.move_to_end(cache_key)
+                return cached.model_copy(update={"processing_time": time.time() - start_time})
+                
             # Parse document
             parser = get_parser(file_path, self.event_bus)
             if not parser:
@@ -116,29 +174,26 @@ class AnalyzeDocumentTool(BaseTool):
                 )
                 
             await parser.initialize()
-            content = file_path.read_text(encoding='utf-8')
-            document = await parser.parse(content, file_path)
+            document = await parse_file_cached(file_path, parser, stat)
             
-            # Gather statistics if requested
-            statistics = None
-            if request.include_statistics:
-                statistics = await self._calculate_statistics(document, content)
-                
-            # Analyze category distribution
-            category_distribution = await self._analyze_categories(document)
+            # Section sizes are shared by every analysis step below
+            section_sizes = [len(section.content) for section in document.sections]
             
-            # Analyze growth patterns if requested
-            growth_patterns = None
-            if request.include_growth:
-                growth_patterns = await self._analyze_growth(
-                    file_path, document, request.days_for_growth
+            # The document-only stages are CPU bound, so large documents run
+            # them as one executor job to keep other requests responsive
+            if len(document.sections) > OFFLOAD_SECTION_THRESHOLD:
+                stages = await loop.run_in_executor(
+                    None, self._analyze_document, file_path, document, section_sizes, request
                 )
-                
+            else:
+                stages = self._analyze_document(file_path, document, section_sizes, request)
+            statistics, category_distribution, section_categories, growth_patterns = stages
+            
             # Generate recommendations if requested
             recommendations = []
             if request.include_recommendations:
                 recommendations = await self._generate_recommendations(
-                    document, statistics, category_distribution
+                    document, statistics, category_distribution, section_categories, section_sizes
                 )
                 
             # Generate insights
@@ -146,7 +201,7 @@ class AnalyzeDocumentTool(BaseTool):
                 document, statistics, category_distribution, growth_patterns
             )
             
-            return AnalyzeDocumentResponse(
+            response = AnalyzeDocumentResponse(
                 success=True,
                 document_id=document.id,
                 file_path=request.file_path,
@@ -159,6 +214,12 @@ class AnalyzeDocumentTool(BaseTool):
                 processing_time=time.time() - start_time
             )
             
+            self._results[cache_key] = response
+            if len(self._results) > ANALYSIS_CACHE_SIZE:
+                self._results.popitem(last=False)
+                
+            return response
+            
         except Exception as e:
             self._logger.error("analyze_document_failed", error=str(e))
             return AnalyzeDocumentResponse(
@@ -170,64 +231,110 @@ class AnalyzeDocumentTool(BaseTool):
                 processing_time=time.time() - start_time
             )
             
-    async def _calculate_statistics(self, document, content: str) -> DocumentStatistics:
-        """Calculate document statistics."""
-        lines = content.split('\n')
+    def _analyze_document(
+        self,
+        file_path: Path,
+        document,
+        section_sizes: List[int],
+        request: AnalyzeDocumentRequest
+    ) -> Tuple[
+        Optional[DocumentStatistics],
+        List[CategoryDistribution],
+        Dict[str, str],
+        Optional[GrowthPattern]
+    ]:
+        """Run the analysis stages that only need the parsed document."""
+        # Gather statistics if requested
+        statistics = None
+        if request.include_statistics:
+            statistics = self._calculate_statistics(document, document.content, section_sizes)
+            
+        # Analyze category distribution
+        category_distribution, section_categories = self._analyze_categories(
+            document, section_sizes
+        )
         
-        # Section depth distribution
-        depth_distribution = Counter()
-        total_section_size = 0
+        # Analyze growth patterns if requested
+        growth_patterns = None
+        if request.include_growth:
+            growth_patterns = self._analyze_growth(
+                file_path, document, request.days_for_growth
+            )
+            
+        return statistics, category_distribution, section_categories, growth_patterns
+        
+    def _calculate_statistics(
+        self,
+        document,
+        content: str,
+        section_sizes: List[int]
+    ) -> DocumentStatistics:
+        """Calculate document statistics."""
+        # Section depth distribution; only a handful of levels, so a plain dict
+        depth_distribution: Dict[int, int] = {}
         
         for section in document.sections:
-            depth_distribution[section.level] += 1
-            total_section_size += len(section.content)
+            level = section.level
+            depth_distribution[level] = depth_distribution.get(level, 0) + 1
+            
+        total_section_size = sum(section_sizes)
             
-        # Count code blocks, links, and images
-        import re
-        code_blocks = len(re.findall(r'```[\s\S]*?```', content))
-        links = len(re.findall(r'\[([^\]]+)\]\(([^)]+)\)', content))
-        images = len(re.findall(r'!\[([^\]]*)\]\(([^)]+)\)', content))
+        # Count lines, code blocks, links, and images
+        total_lines, code_blocks, links, images = _scan_counts(content)
         
         return DocumentStatistics(
             total_size=len(content),
-            total_lines=len(lines),
+            total_lines=total_lines,
             total_sections=len(document.sections),
-            section_depth_distribution=dict(depth_distribution),
+            section_depth_distribution=depth_distribution,
             average_section_size=total_section_size / len(document.sections) if document.sections else 0,
             code_block_count=code_blocks,
             link_count=links,
             image_count=images
         )
         
-    async def _analyze_categories(self, document) -> List[CategoryDistribution]:
-        """Analyze content distribution by category."""
-        from ...extractor import CategoryDetector
-        
-        detector = CategoryDetector()
+    def _analyze_categories(
+        self,
+        document,
+        section_sizes: List[int]
+    ) -> Tuple[List[CategoryDistribution], Dict[str, str]]:
+        """Analyze content distribution by category.
         
-        category_counts = Counter()
-        category_sizes = Counter()
+        Also returns each section's detected category, keyed by section id.
+        """
+        # category -> [section count, total size]
+        totals: Dict[str, List[int]] = {}
+        section_categories: Dict[str, str] = {}
+        total_size = 0
         
-        for section in document.sections:
-            category, confidence = detector.detect_category(section.content, section.title)
+        for section, size in zip(document.sections, section_sizes):
+            category, confidence = _detector.detect_category(section.content, section.title)
+            section_categories[section.id] = category.value
             if category != ExtractionCategory.CUSTOM:
-                category_counts[category.value] += 1
-                category_sizes[category.value] += len(section.content)
+                entry = totals.setdefault(category.value, [0, 0])
+                entry[0] += 1
+                entry[1] += size
+                total_size += size
                 
-        total_size = sum(category_sizes.values())
+        # Most common first; ties keep first-seen order
+        ranked = sorted(totals.items(), key=lambda item: item[1][0], reverse=True)
+        
+        # Percent per character of categorized content
+        scale = 100 / total_size if total_size > 0 else 0.0
         
+        # Values are computed here, so pydantic validation is skipped
         distributions = []
-        for category, count in category_counts.most_common():
-            distributions.append(CategoryDistribution(
+        for category, (count, size) in ranked:
+            distributions.append(CategoryDistribution.model_construct(
                 category=category,
                 section_count=count,
-                estimated_size=category_sizes[category],
-                percentage=(category_sizes[category] / total_size * 100) if total_size > 0 else 0
+                estimated_size=size,
+                percentage=size * scale
             ))
             
-        return distributions
+        return distributions, section_categories
         
-    async def _analyze_growth(
+    def _analyze_growth(
         self, 
         file_path: Path, 
         document,
@@ -261,7 +368,7 @@ class AnalyzeDocumentTool(BaseTool):
                 
             return GrowthPattern(
                 period_days=days,
-                lines_added=int(len(document.content.split('\n')) * estimated_growth_rate / 100),
+                lines_added=int((document.content.count('\n') + 1) * estimated_growth_rate / 100),
                 sections_added=int(total_sections * estimated_growth_rate / 100),
                 growth_rate=estimated_growth_rate,
                 most_active_categories=most_active
@@ -275,61 +382,75 @@ class AnalyzeDocumentTool(BaseTool):
         self,
         document,
         statistics: Optional[DocumentStatistics],
-        category_distribution: List[CategoryDistribution]
+        category_distribution: List[CategoryDistribution],
+        section_categories: Dict[str, str],
+        section_sizes: List[int]
     ) -> List[ExtractionRecommendation]:
-        """Generate extraction recommendations."""
-        recommendations = []
+        """Generate extraction recommendations, highest priority first."""
+        # Min-heap of (score, -order, recommendation) holding the best so far
+        heap: List[Tuple[int, int, ExtractionRecommendation]] = []
+        order = 0
         
+        def add(priority: str, **fields: Any) -> None:
+            nonlocal order
+            score = _PRIORITY_SCORES[priority]
+            order += 1
+            # Earlier candidates win ties, so a full heap only takes a strictly better one
+            if len(heap) >= MAX_RECOMMENDATIONS and score <= heap[0][0]:
+                return
+            # Fields come from the parsed document, so validation is skipped
+            recommendation = ExtractionRecommendation.model_construct(priority=priority, **fields)
+            item = (score, -order, recommendation)
+            if len(heap) < MAX_RECOMMENDATIONS:
+                heapq.heappush(heap, item)
+            else:
+                heapq.heapreplace(heap, item)
+                
         # Find large sections that could be extracted
         if statistics:
-            avg_size = statistics.average_section_size
-            for section in document.sections:
-                if len(section.content) > avg_size * 2:  # Section is 2x average size
-                    recommendations.append(ExtractionRecommendation(
+            large_threshold = statistics.average_section_size * 2
+            for section, size in zip(document.sections, section_sizes):
+                if size > large_threshold:  # Section is 2x average size
+                    add(
+                        "high",
                         section_id=section.id,
                         title=section.title,
                         category="Large Content",
                         reason="Section is significantly larger than average",
-                        priority="high",
                         estimated_impact="Reduce document complexity"
-                    ))
+                    )
                     
-        # Find categories with high concentration
-        total_sections = sum(dist.section_count for dist in category_distribution)
+        # Find categories with high concentration, checking the first 5 sections
+        first_by_category: Dict[str, Any] = {}
+        for section in document.sections[:5]:
+            first_by_category.setdefault(section_categories.get(section.id), section)
+            
         for dist in category_distribution:
             if dist.percentage > 30:  # More than 30% of content
-                # Find sections in this category
-                from ...extractor import CategoryDetector
-                detector = CategoryDetector()
-                
-                for section in document.sections[:5]:  # Check first 5 sections
-                    category, _ = detector.detect_category(section.content, section.title)
-                    if category.value == dist.category:
-                        recommendations.append(ExtractionRecommendation(
-                            section_id=section.id,
-                            title=section.title,
-                            category=dist.category,
-                            reason=f"High concentration of {dist.category} content",
-                            priority="medium",
-                            estimated_impact="Better content organization"
-                        ))
-                        break
+                section = first_by_category.get(dist.category)
+                if section is not None:
+                    add(
+                        "medium",
+                        section_id=section.id,
+                        title=section.title,
+                        category=dist.category,
+                        reason=f"High concentration of {dist.category} content",
+                        estimated_impact="Better content organization"
+                    )
                         
         # Find critical sections
-        critical_keywords = ["IMPORTANT", "CRITICAL", "URGENT", "REQUIRED"]
         for section in document.sections:
-            if any(keyword in section.content.upper() for keyword in critical_keywords):
-                recommendations.append(ExtractionRecommendation(
+            if _CRITICAL_RE.search(section.content):
+                add(
+                    "high",
                     section_id=section.id,
                     title=section.title,
                     category="Critical",
                     reason="Contains critical information",
-                    priority="high",
                     estimated_impact="Ensure critical info is highlighted"
-                ))
+                )
                 
-        # Limit recommendations
-        return recommendations[:10]
+        return [item[2] for item in sorted(heap, reverse=True)]
         
     def _generate_insights(
         self,
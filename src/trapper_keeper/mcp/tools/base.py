@@ -57,7 +57,7 @@ class BaseTool(ABC):
         """
         self._logger.info(
             "tool_executed",
-            request=request.dict(),
+            request=request.model_dump(exclude_defaults=True),
             response_keys=list(response.keys()),
             duration=duration,
             success=response.get("success", True)
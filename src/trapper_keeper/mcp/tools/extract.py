@@ -1,14 +1,41 @@
 """Extract content tool for MCP."""
 
+import asyncio
+import re
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Union
 from pydantic import BaseModel, Field
 
 from .base import BaseTool
-from ...core.types import ExtractedContent, ExtractionCategory
-from ...parser import get_parser
+from ...core.types import ExtractedContent, ExtractionCategory, ProcessingOverrides
+from ...parser import get_parser, parse_file_cached
 from ...extractor import ContentExtractor
+from ...organizer import DocumentOrganizer
+
+
+# Group references and "(?" constructs (inline flags, conditionals, named
+# groups) can change meaning once patterns are combined, so any pattern
+# containing them is compiled on its own
+_UNSAFE_TO_COMBINE_RE = re.compile(r'\\[1-9]|\(\?')
+
+
+@lru_cache(maxsize=512)
+def _compile_ci(patterns: Tuple[str, ...]) -> List[Pattern]:
+    """Compile user patterns for case-insensitive search, reusing past compiles.
+    
+    Patterns are combined into one alternation where possible so each
+    section needs a single search. Invalid patterns raise re.error.
+    """
+    compiled = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+    if len(compiled) < 2 or any(_UNSAFE_TO_COMBINE_RE.search(pattern) for pattern in patterns):
+        return compiled
+        
+    try:
+        return [re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)]
+    except re.error:
+        return compiled
 
 
 class ExtractContentRequest(BaseModel):
@@ -55,11 +82,15 @@ class ExtractContentTool(BaseTool):
     def __init__(self, config, event_bus=None):
         super().__init__("extract_content", config, event_bus)
         self.extractor: Optional[ContentExtractor] = None
+        self.organizer: Optional[DocumentOrganizer] = None
         
     async def initialize(self) -> None:
         """Initialize tool components."""
         self.extractor = ContentExtractor(self.config.processing, self.event_bus)
+        self.organizer = DocumentOrganizer(self.config.organization, self.event_bus)
+        
         await self.extractor.initialize()
+        await self.organizer.initialize()
         
     async def execute(self, request: ExtractContentRequest) -> ExtractContentResponse:
         """Execute the extract content tool."""
@@ -72,7 +103,10 @@ class ExtractContentTool(BaseTool):
         try:
             # Parse the document
             file_path = Path(request.file_path)
-            if not file_path.exists():
+            loop = asyncio.get_running_loop()
+            try:
+                stat = await loop.run_in_executor(None, file_path.stat)
+            except FileNotFoundError:
                 return ExtractContentResponse(
                     success=False,
                     document_id="",
@@ -103,55 +137,42 @@ class ExtractContentTool(BaseTool):
                 )
                 
             await parser.initialize()
-            content = file_path.read_text(encoding='utf-8')
-            document = await parser.parse(content, file_path)
+            document = await parse_file_cached(file_path, parser, stat)
             
             # Extract sections based on criteria
             extracted_sections = []
             categories_extracted = set()
             
-            # If specific section IDs provided
-            if request.section_ids:
+            # Select sections by id and pattern in a single pass
+            wanted_ids = frozenset(request.section_ids) if request.section_ids else None
+            compiled = _compile_ci(tuple(request.patterns)) if request.patterns else None
+            if wanted_ids is None and compiled is None:
+                sections_to_extract = document.sections
+            else:
                 sections_to_extract = [
-                    s for s in document.sections 
-                    if s.id in request.section_ids
+                    s for s in document.sections
+                    if (wanted_ids is None or s.id in wanted_ids)
+                    and (compiled is None or any(c.search(s.content) for c in compiled))
                 ]
-            else:
-                sections_to_extract = document.sections
-                
-            # Apply pattern matching if specified
-            if request.patterns:
-                import re
-                pattern_sections = []
-                for section in sections_to_extract:
-                    for pattern in request.patterns:
-                        if re.search(pattern, section.content, re.IGNORECASE):
-                            pattern_sections.append(section)
-                            break
-                sections_to_extract = pattern_sections
                 
             # Extract content from selected sections
             if not request.dry_run:
-                # Configure extractor
-                if request.categories:
-                    self.config.processing.extract_categories = [
-                        ExtractionCategory(cat) if cat in [e.value for e in ExtractionCategory]
-                        else cat
-                        for cat in request.categories
-                    ]
-                    
+                # Request categories apply to this call only
+                overrides = ProcessingOverrides(
+                    extract_categories=tuple(request.categories) if request.categories else None
+                )
                 extracted_contents = await self.extractor.extract_from_sections(
-                    document, sections_to_extract
+                    document, sections_to_extract, overrides
                 )
             else:
                 # For dry run, simulate extraction
                 extracted_contents = []
+                detector = self.extractor.category_detector
+                wanted = frozenset(request.categories or ())
                 for section in sections_to_extract:
                     # Detect category
-                    from ...extractor import CategoryDetector
-                    detector = CategoryDetector()
                     category, confidence = detector.detect_category(section.content, section.title)
-                    if request.categories and category.value not in request.categories:
+                    if wanted and category.value not in wanted:
                         continue
                         
                     extracted_contents.append(
@@ -167,21 +188,27 @@ class ExtractContentTool(BaseTool):
                     
             # Build response sections
             output_files = []
+            section_index = {}
+            if request.preserve_context:
+                section_index = {section.id: i for i, section in enumerate(document.sections)}
+                
             for content in extracted_contents:
-                categories_extracted.add(content.category.value if hasattr(content.category, 'value') else content.category)
+                category = content.category_str
+                categories_extracted.add(category)
                 
                 # Get context if requested
                 context_before = None
                 context_after = None
                 if request.preserve_context:
                     context_before, context_after = self._get_section_context(
-                        document, content.source_section
+                        document, section_index, content.source_section
                     )
                     
-                extracted_section = ExtractedSection(
+                # Built from our own parsed data, so pydantic validation is skipped
+                extracted_section = ExtractedSection.model_construct(
                     section_id=content.source_section or content.id,
                     title=content.title,
-                    category=content.category.value if hasattr(content.category, 'value') else content.category,
+                    category=category,
                     content=content.content,
                     context_before=context_before,
                     context_after=context_after
@@ -192,12 +219,8 @@ class ExtractContentTool(BaseTool):
             if not request.dry_run and extracted_contents:
                 output_dir = Path(request.output_dir) if request.output_dir else self.config.organization.output_dir
                 
-                from ...organizer import DocumentOrganizer
-                organizer = DocumentOrganizer(self.config.organization, self.event_bus)
-                await organizer.initialize()
-                
-                organized = await organizer.organize(extracted_contents)
-                saved_files = await organizer.save(organized, output_dir)
+                organized = await self.organizer.organize(extracted_contents)
+                saved_files = await self.organizer.save(organized, output_dir)
                 output_files = [str(f) for f in saved_files]
                 
                 # Update output files in sections
@@ -238,35 +261,38 @@ class ExtractContentTool(BaseTool):
                 dry_run=request.dry_run
             )
             
-    def _get_section_context(self, document, section_id: str, context_size: int = 200):
-        """Get context before and after a section."""
-        # Find section index
-        section_idx = None
-        for i, section in enumerate(document.sections):
-            if section.id == section_id:
-                section_idx = i
-                break
-                
+    def _get_section_context(
+        self,
+        document,
+        section_index: Dict[str, int],
+        section_id: str,
+        context_size: int = 200
+    ):
+        """Get context before and after a section.
+        
+        ``section_index`` maps section ids to their position in the document.
+        """
+        section_idx = section_index.get(section_id)
         if section_idx is None:
             return None, None
             
         # Get previous section content (last N characters)
         context_before = None
         if section_idx > 0:
-            prev_section = document.sections[section_idx - 1]
-            if len(prev_section.content) > context_size:
-                context_before = "..." + prev_section.content[-context_size:]
+            prev_content = document.sections[section_idx - 1].content
+            if len(prev_content) > context_size:
+                context_before = f"...{prev_content[-context_size:]}"
             else:
-                context_before = prev_section.content
+                context_before = prev_content
                 
         # Get next section content (first N characters)
         context_after = None
         if section_idx < len(document.sections) - 1:
-            next_section = document.sections[section_idx + 1]
-            if len(next_section.content) > context_size:
-                context_after = next_section.content[:context_size] + "..."
+            next_content = document.sections[section_idx + 1].content
+            if len(next_content) > context_size:
+                context_after = f"{next_content[:context_size]}..."
             else:
-                context_after = next_section.content
+                context_after = next_content
                 
         return context_before, context_after
         
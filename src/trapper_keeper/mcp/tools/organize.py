@@ -1,16 +1,34 @@
 """Organize documentation tool for MCP."""
 
+import asyncio
+import re
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field
 
 from .base import BaseTool
-from ...core.types import ExtractionCategory, ProcessingResult
-from ...parser import get_parser
+from ...core.types import ExtractionCategory, ProcessingOverrides, ProcessingResult
+from ...parser import get_parser, parse_file_cached
 from ...extractor import ContentExtractor, CategoryDetector
 from ...organizer import DocumentOrganizer
 
+# Keywords that raise a section's importance, matched anywhere in any case
+_IMPORTANT_RE = re.compile(
+    r'IMPORTANT|CRITICAL|WARNING|REQUIRED|MUST|ESSENTIAL|KEY|CORE',
+    re.IGNORECASE
+)
+
+# Documents with more sections than this run category detection off the event loop
+OFFLOAD_SECTION_THRESHOLD = 8
+
+# Categories that always raise a section's importance
+_CRITICAL_CATEGORIES = frozenset({
+    ExtractionCategory.CRITICAL,
+    ExtractionCategory.SECURITY,
+    ExtractionCategory.ARCHITECTURE
+})
+
 
 class OrganizeDocumentationRequest(BaseModel):
     """Request to organize documentation."""
@@ -59,11 +77,11 @@ class OrganizeDocumentationTool(BaseTool):
         """Initialize tool components."""
         self.extractor = ContentExtractor(self.config.processing, self.event_bus)
         self.organizer = DocumentOrganizer(self.config.organization, self.event_bus)
-        self.category_detector = CategoryDetector(self.config.processing, self.event_bus)
+        # Reuse the extractor's detector rather than building another one
+        self.category_detector = self.extractor.category_detector
         
         await self.extractor.initialize()
         await self.organizer.initialize()
-        await self.category_detector.initialize()
         
     async def execute(self, request: OrganizeDocumentationRequest) -> OrganizeDocumentationResponse:
         """Execute the organize documentation tool."""
@@ -76,7 +94,10 @@ class OrganizeDocumentationTool(BaseTool):
         try:
             # Parse the document
             file_path = Path(request.file_path)
-            if not file_path.exists():
+            loop = asyncio.get_running_loop()
+            try:
+                stat = await loop.run_in_executor(None, file_path.stat)
+            except FileNotFoundError:
                 return OrganizeDocumentationResponse(
                     success=False,
                     document_id="",
@@ -105,61 +126,68 @@ class OrganizeDocumentationTool(BaseTool):
                 )
                 
             await parser.initialize()
-            content = file_path.read_text(encoding='utf-8')
-            document = await parser.parse(content, file_path)
+            document = await parse_file_cached(file_path, parser, stat)
             
             # Generate extraction suggestions
             suggestions = []
             categories_found = set()
+            wanted = frozenset(request.categories or ())
             
-            for section in document.sections:
-                # Detect category
-                category, confidence = self.category_detector.detect_category(section.content, section.title)
+            # Detection is CPU bound, so large documents run it as one
+            # executor job to keep other requests responsive
+            if len(document.sections) > OFFLOAD_SECTION_THRESHOLD:
+                loop = asyncio.get_running_loop()
+                detections = await loop.run_in_executor(
+                    None, self._detect_categories, document.sections
+                )
+            else:
+                detections = self._detect_categories(document.sections)
+                
+            for section, (category, confidence) in zip(document.sections, detections):
                 if category == ExtractionCategory.CUSTOM:
                     continue
                     
+                # Skip unrequested categories before scoring them
+                if wanted and category.value not in wanted:
+                    continue
+                    
                 # Calculate importance
                 importance = self._calculate_importance(section, category)
                 
                 if importance >= request.min_importance:
                     categories_found.add(category.value)
                     
-                    suggestion = ExtractionSuggestion(
+                    suggestion = ExtractionSuggestion.model_construct(
                         section_id=section.id,
                         title=section.title,
                         category=category.value,
                         importance=importance,
                         reason=self._generate_extraction_reason(section, category, importance),
-                        content_preview=section.content[:200] + "..." if len(section.content) > 200 else section.content
+                        content_preview=f"{section.content[:200]}..." if len(section.content) > 200 else section.content
                     )
                     suggestions.append(suggestion)
                     
-            # Filter by requested categories if specified
-            if request.categories:
-                suggestions = [s for s in suggestions if s.category in request.categories]
-                categories_found = categories_found.intersection(set(request.categories))
-                
             # If not dry run, perform extraction
             output_files = []
             extracted_count = 0
             
             if not request.dry_run and suggestions:
-                # Update config if needed
-                if request.categories:
-                    self.config.processing.extract_categories = request.categories
-                self.config.processing.min_importance = request.min_importance
+                # Request settings apply to this call only
+                overrides = ProcessingOverrides(
+                    extract_categories=tuple(request.categories) if request.categories else None,
+                    min_importance=request.min_importance
+                )
                 
                 # Extract content
-                extracted_contents = await self.extractor.extract(document)
+                extracted_contents = await self.extractor.extract(document, overrides)
                 extracted_count = len(extracted_contents)
                 
                 # Organize and save
                 if extracted_contents:
                     output_dir = Path(request.output_dir) if request.output_dir else self.config.organization.output_dir
-                    self.config.organization.output_dir = output_dir
                     
                     organized = await self.organizer.organize(extracted_contents)
-                    saved_files = await self.organizer.save(organized)
+                    saved_files = await self.organizer.save(organized, output_dir)
                     output_files = [str(f) for f in saved_files]
                     
                     # Create references if requested
@@ -191,30 +219,23 @@ class OrganizeDocumentationTool(BaseTool):
                 dry_run=request.dry_run
             )
             
+    def _detect_categories(self, sections) -> List[Tuple[ExtractionCategory, float]]:
+        """Detect the category of each section."""
+        detect = self.category_detector.detect_category
+        return [detect(section.content, section.title) for section in sections]
+        
     def _calculate_importance(self, section, category) -> float:
         """Calculate importance score for a section."""
         score = 0.5  # Base score
         
         # Adjust based on category
-        critical_categories = {
-            ExtractionCategory.CRITICAL,
-            ExtractionCategory.SECURITY,
-            ExtractionCategory.ARCHITECTURE
-        }
-        if category in critical_categories:
+        if category in _CRITICAL_CATEGORIES:
             score += 0.2
             
         # Adjust based on content indicators
-        important_keywords = [
-            "IMPORTANT", "CRITICAL", "WARNING", "REQUIRED",
-            "MUST", "ESSENTIAL", "KEY", "CORE"
-        ]
-        content_upper = section.content.upper()
-        for keyword in important_keywords:
-            if keyword in content_upper:
-                score += 0.1
-                break
-                
+        if _IMPORTANT_RE.search(section.content):
+            score += 0.1
+            
         # Adjust based on section level (higher level = more important)
         if section.level <= 2:
             score += 0.1
@@ -0,0 +1,167 @@
+"""Per-file scan results shared by the MCP tools."""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import yaml
+
+from ...utils.frontmatter import load_frontmatter
+
+# Inline links [text](path), reference links [text][id] and their [id]: path definitions
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_REF_LINK_RE = re.compile(r'\[([^\]]+)\]\[([^\]]+)\]')
+_REF_DEF_RE = re.compile(r'^[ ]{0,3}\[([^\]]+)\]:[ \t]*(\S.*)$', re.MULTILINE)
+
+# Inline "Category: a, b" declarations
+_CATEGORY_RE = re.compile(r'(?:Category|Categories):\s*(.+)', re.IGNORECASE)
+
+# First non-whitespace character
+_NON_SPACE_RE = re.compile(r'\S')
+
+# Maximum number of scanned files kept; entries for old mtimes age out
+PARSE_CACHE_SIZE = 16384
+
+
+@dataclass(frozen=True)
+class ParsedDoc:
+    """Metadata, references and categories found in one file."""
+    metadata: Dict[str, Any]
+    references: Tuple[str, ...]
+    categories: Tuple[str, ...]
+    has_structure: bool
+
+
+def _load_frontmatter_block(content: str) -> Dict[str, Any]:
+    """Return the leading ``---`` frontmatter as a dict, or an empty dict."""
+    if not content.startswith("---"):
+        return {}
+    try:
+        frontmatter_end = content.find("---", 3)
+        if frontmatter_end > 0:
+            data = load_frontmatter(content[3:frontmatter_end])
+            if isinstance(data, dict):
+                return data
+    except (yaml.YAMLError, ValueError, TypeError):
+        # Malformed YAML, or a value such as a bad date that fails conversion
+        pass
+    return {}
+
+
+def _head_lines(content: str, count: int) -> List[str]:
+    """Return the first ``count`` lines without splitting the rest of the content."""
+    end = -1
+    for _ in range(count):
+        end = content.find('\n', end + 1)
+        if end < 0:
+            return content.split('\n')
+    return content[:end].split('\n')
+
+
+def _extract_metadata(content: str, frontmatter: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract metadata from frontmatter, the title and category lines."""
+    metadata = dict(frontmatter)
+
+    # Look for headers
+    lines = _head_lines(content, 20)
+    for line in lines[:10]:  # Check first 10 lines
+        if line.startswith("# "):
+            metadata["title"] = line[2:].strip()
+            break
+
+    # Look for category indicators
+    for line in lines:
+        if "Category:" in line or "category:" in line:
+            metadata["category"] = line.split(":", 1)[1].strip()
+            break
+
+    return metadata
+
+
+def _extract_references(content: str) -> List[str]:
+    """Extract all local references from content."""
+    references = []
+
+    # Each link form needs a literal "](" or "][", so a substring check
+    # skips the regex scan for content without links
+
+    # Markdown links: [text](path)
+    if '](' in content:
+        md_links = _MD_LINK_RE.findall(content)
+        references.extend([link[1] for link in md_links if not link[1].startswith('http')])
+
+    # Reference-style links: [text][ref]
+    ref_links = _REF_LINK_RE.findall(content) if '][' in content else []
+    if ref_links:
+        # Collect definitions in one scan; the first definition of an id wins
+        definitions = {}
+        for ref_id, target in _REF_DEF_RE.findall(content):
+            definitions.setdefault(ref_id, target)
+
+        for _, ref_id in ref_links:
+            target = definitions.get(ref_id)
+            if target and not target.startswith('http'):
+                references.append(target)
+
+    return references
+
+
+def _extract_categories(content: str, frontmatter: Dict[str, Any]) -> List[str]:
+    """Extract categories from frontmatter and category declarations."""
+    categories = []
+
+    # Look for category in frontmatter
+    try:
+        if "category" in frontmatter:
+            categories.append(frontmatter["category"])
+        if "categories" in frontmatter:
+            categories.extend(frontmatter["categories"])
+    except TypeError:
+        # "categories" was a scalar rather than a list
+        pass
+
+    # Look for category headers
+    for match in _CATEGORY_RE.findall(content):
+        categories.extend([c.strip() for c in match.split(',')])
+
+    return list(dict.fromkeys(categories))  # Remove duplicates, keeping first-seen order
+
+
+def _has_expected_structure(content: str) -> bool:
+    """Check that content starts with a title and has a body."""
+    # Measure the stripped text by its bounds instead of copying it
+    first = _NON_SPACE_RE.search(content)
+    if first is None:
+        return False
+    start = first.start()
+    end = len(content)
+    while content[end - 1].isspace():
+        end -= 1
+
+    has_title = content.startswith('#', start) or '---' in content[:10]
+    has_content = end - start > 50  # Arbitrary minimum
+
+    return has_title and has_content
+
+
+def scan_content(content: str) -> ParsedDoc:
+    """Scan file content for metadata, references and categories in one pass."""
+    frontmatter = _load_frontmatter_block(content)
+    return ParsedDoc(
+        metadata=_extract_metadata(content, frontmatter),
+        references=tuple(_extract_references(content)),
+        categories=tuple(_extract_categories(content, frontmatter)),
+        has_structure=_has_expected_structure(content),
+    )
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_doc(path_str: str, mtime_ns: int, size: int) -> ParsedDoc:
+    """Read and scan a file, once per ``(path, mtime_ns, size)``.
+
+    Callers pass the file's current stat so an edited file is rescanned.
+    The result is shared between callers and must not be modified.
+    """
+    return scan_content(Path(path_str).read_text(encoding='utf-8'))
@@ -1,13 +1,21 @@
 """Create reference tool for MCP."""
 
+import asyncio
+import re
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
-from datetime import datetime
+from datetime import date
+import aiofiles
 
 from .base import BaseTool
+from .parse_cache import parse_doc
 from ...extractor import ReferenceGenerator
+from ...utils.files import read_text, write_text
+
+# Markdown header lines
+_HEADER_LINE_RE = re.compile(r'^#.*$', re.MULTILINE)
 
 
 class CreateReferenceRequest(BaseModel):
@@ -96,19 +104,21 @@ class CreateReferenceTool(BaseTool):
                 
             # Generate references
             references_created = []
+            today = date.today().isoformat()
             
             # Read source content
-            source_content = source_path.read_text(encoding='utf-8')
+            source_content = await read_text(source_path)
             updated_content = source_content
             
+            # Read extracted file metadata concurrently in the default executor
+            loop = asyncio.get_running_loop()
+            all_metadata = await asyncio.gather(*(
+                loop.run_in_executor(None, self._load_metadata, extracted_path)
+                for extracted_path in extracted_paths
+            ))
+            
             # Process each extracted file
-            for extracted_path in extracted_paths:
-                # Read extracted content metadata
-                extracted_content = extracted_path.read_text(encoding='utf-8')
-                
-                # Extract metadata from content (assuming frontmatter or headers)
-                metadata = self._extract_metadata(extracted_content)
-                
+            for extracted_path, metadata in zip(extracted_paths, all_metadata):
                 # Generate reference link
                 if request.reference_format == "markdown":
                     link = self._create_markdown_link(
@@ -120,7 +130,7 @@ class CreateReferenceTool(BaseTool):
                     )
                 else:  # index format
                     link = self._create_index_link(
-                        source_path, extracted_path, metadata
+                        source_path, extracted_path, metadata, today
                     )
                     
                 reference = ReferenceLink(
@@ -143,21 +153,26 @@ class CreateReferenceTool(BaseTool):
             # Save updated source if changed
             source_updated = False
             if request.update_source and updated_content != source_content:
-                source_path.write_text(updated_content, encoding='utf-8')
+                await write_text(source_path, updated_content)
                 source_updated = True
                 
             # Create backlinks if requested
             backlinks_created = 0
             if request.create_backlinks:
-                for extracted_path in extracted_paths:
-                    if await self._add_backlink(extracted_path, source_path):
-                        backlinks_created += 1
+                # Link each distinct file once so concurrent appends can't race
+                unique_paths = list(dict.fromkeys(extracted_paths))
+                results = await asyncio.gather(*(
+                    self._add_backlink(extracted_path, source_path)
+                    for extracted_path in unique_paths
+                ))
+                linked = dict(zip(unique_paths, results))
+                backlinks_created = sum(1 for path in extracted_paths if linked[path])
                         
             # Update index if requested
             index_updated = False
             if request.index_file:
                 index_path = Path(request.index_file)
-                if await self._update_index(index_path, references_created):
+                if await self._update_index(index_path, references_created, today):
                     index_updated = True
                     
             return CreateReferenceResponse(
@@ -183,35 +198,10 @@ class CreateReferenceTool(BaseTool):
                 processing_time=time.time() - start_time
             )
             
-    def _extract_metadata(self, content: str) -> Dict[str, Any]:
-        """Extract metadata from file content."""
-        metadata = {}
-        
-        # Look for frontmatter
-        if content.startswith("---"):
-            try:
-                import yaml
-                frontmatter_end = content.find("---", 3)
-                if frontmatter_end > 0:
-                    frontmatter = content[3:frontmatter_end]
-                    metadata = yaml.safe_load(frontmatter) or {}
-            except:
-                pass
-                
-        # Look for headers
-        lines = content.split('\n')
-        for line in lines[:10]:  # Check first 10 lines
-            if line.startswith("# "):
-                metadata["title"] = line[2:].strip()
-                break
-                
-        # Look for category indicators
-        for line in lines[:20]:
-            if "Category:" in line or "category:" in line:
-                metadata["category"] = line.split(":", 1)[1].strip()
-                break
-                
-        return metadata
+    def _load_metadata(self, extracted_path: Path) -> Dict[str, Any]:
+        """Extract metadata from content (assuming frontmatter or headers)."""
+        stat = extracted_path.stat()
+        return parse_doc(str(extracted_path), stat.st_mtime_ns, stat.st_size).metadata
         
     def _create_markdown_link(self, source_path: Path, target_path: Path, metadata: Dict) -> Dict:
         """Create a markdown-style reference link."""
@@ -238,7 +228,13 @@ class CreateReferenceTool(BaseTool):
             "format": f"\n- [{title}]({relative_path})"
         }
         
-    def _create_index_link(self, source_path: Path, target_path: Path, metadata: Dict) -> Dict:
+    def _create_index_link(
+        self,
+        source_path: Path,
+        target_path: Path,
+        metadata: Dict,
+        today: str
+    ) -> Dict:
         """Create an index-style reference link."""
         relative_path = self._get_relative_path(source_path.parent, target_path)
         title = metadata.get("title", target_path.stem)
@@ -246,7 +242,7 @@ class CreateReferenceTool(BaseTool):
         
         return {
             "text": f"{category}: {title}",
-            "format": f"| {category} | [{title}]({relative_path}) | {datetime.now().strftime('%Y-%m-%d')} |"
+            "format": f"| {category} | [{title}]({relative_path}) | {today} |"
         }
         
     def _get_relative_path(self, from_dir: Path, to_path: Path) -> str:
@@ -261,63 +257,84 @@ class CreateReferenceTool(BaseTool):
         """Insert reference link in the appropriate section."""
         # This is a simplified implementation
         # In practice, would need to parse the document structure
-        lines = content.split('\n')
-        updated_lines = []
+        pieces = []
+        last = 0
         
         in_section = False
-        for line in lines:
-            updated_lines.append(line)
-            
+        for match in _HEADER_LINE_RE.finditer(content):
             # Simple heuristic: look for section headers
-            if section_id in line and line.startswith("#"):
+            if section_id in match.group():
                 in_section = True
-            elif in_section and line.startswith("#"):
-                # End of section, insert reference before next section
-                updated_lines.insert(-1, reference)
+            elif in_section:
+                # End of section, insert reference line before next section
+                pieces.append(content[last:match.start()])
+                pieces.append(reference + '\n')
+                last = match.start()
                 in_section = False
                 
+        pieces.append(content[last:])
+        
         # If still in section at end, append reference
         if in_section:
-            updated_lines.append(reference)
+            pieces.append('\n' + reference)
             
-        return '\n'.join(updated_lines)
+        return ''.join(pieces)
         
     async def _add_backlink(self, extracted_path: Path, source_path: Path) -> bool:
         """Add a backlink from extracted content to source."""
         try:
-            content = extracted_path.read_text(encoding='utf-8')
-            
-            # Add backlink at the end
-            relative_source = self._get_relative_path(extracted_path.parent, source_path)
-            backlink = f"\n\n---\n\n**Source**: [{source_path.name}]({relative_source})\n"
-            
-            if backlink not in content:
-                content += backlink
-                extracted_path.write_text(content, encoding='utf-8')
-                
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._append_backlink, extracted_path, source_path)
             return True
         except Exception as e:
             self._logger.error("add_backlink_failed", error=str(e))
             return False
             
-    async def _update_index(self, index_path: Path, references: List[ReferenceLink]) -> bool:
+    def _append_backlink(self, extracted_path: Path, source_path: Path) -> None:
+        """Append the backlink to an extracted file unless it is already there."""
+        content = extracted_path.read_text(encoding='utf-8')
+        
+        # Add backlink at the end
+        relative_source = self._get_relative_path(extracted_path.parent, source_path)
+        backlink = f"\n\n---\n\n**Source**: [{source_path.name}]({relative_source})\n"
+        
+        # Already linked files are left untouched; otherwise append the
+        # backlink rather than rewriting the whole file
+        if backlink not in content:
+            with extracted_path.open('a', encoding='utf-8') as f:
+                f.write(backlink)
+                
+    async def _update_index(
+        self,
+        index_path: Path,
+        references: List[ReferenceLink],
+        today: str
+    ) -> bool:
         """Update index file with new references."""
         try:
-            # Create index if it doesn't exist
-            if not index_path.exists():
-                index_content = "# Extracted Content Index\n\n"
-                index_content += "| Category | Title | File | Date |\n"
-                index_content += "|----------|-------|------|------|\n"
-            else:
-                index_content = index_path.read_text(encoding='utf-8')
+            try:
+                seen = set((await read_text(index_path)).split('\n'))
+            except FileNotFoundError:
+                # Create index if it doesn't exist
+                await write_text(
+                    index_path,
+                    "# Extracted Content Index\n\n"
+                    "| Category | Title | File | Date |\n"
+                    "|----------|-------|------|------|\n"
+                )
+                seen = set()
                 
-            # Add new references
+            # Append only references not already listed
+            new_lines = []
             for ref in references:
-                index_line = f"| {ref.category} | {ref.link_text} | {ref.target_file} | {datetime.now().strftime('%Y-%m-%d')} |\n"
-                if index_line not in index_content:
-                    index_content += index_line
+                index_line = f"| {ref.category} | {ref.link_text} | {ref.target_file} | {today} |"
+                if index_line not in seen:
+                    seen.add(index_line)
+                    new_lines.append(index_line + "\n")
                     
-            index_path.write_text(index_content, encoding='utf-8')
+            if new_lines:
+                async with aiofiles.open(index_path, 'a', encoding='utf-8') as f:
+                    await f.write(''.join(new_lines))
             return True
             
         except Exception as e:
@@ -1,11 +1,16 @@
 """Validate structure tool for MCP."""
 
+import asyncio
+import os
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from pydantic import BaseModel, Field
 
 from .base import BaseTool
+from .parse_cache import parse_doc
+from ...core.types import ExtractionCategory
+from ...utils.files import iter_matching_files
 
 
 class ValidateStructureRequest(BaseModel):
@@ -88,18 +93,32 @@ class ValidateStructureTool(BaseTool):
             if request.source_files:
                 files_to_check = [Path(f) for f in request.source_files if Path(f).exists()]
             else:
-                # Find all matching files
-                for pattern in request.patterns:
-                    files_to_check.extend(root_path.rglob(pattern))
+                # Find all matching files in one walk of the tree
+                files_to_check = list(iter_matching_files(root_path, request.patterns))
                     
+            # Known files by absolute path, so references to them resolve
+            # without stat probes; resolved paths are filled in on first use
+            known_files: Dict[str, Optional[Path]] = {
+                os.path.abspath(f): None for f in files_to_check
+            }
+            
             # Validate each file
             file_validations = []
             all_issues = []
             all_references = {}  # Map of file -> list of references
             referenced_files = set()  # Files that are referenced by others
             
-            for file_path in files_to_check:
-                validation = await self._validate_file(file_path, root_path, request)
+            # File checks are blocking reads and stats, so run them in the
+            # default executor, whose worker count bounds the open files
+            loop = asyncio.get_running_loop()
+            results = await asyncio.gather(*(
+                loop.run_in_executor(
+                    None, self._validate_file, file_path, root_path, request, known_files
+                )
+                for file_path in files_to_check
+            ))
+            
+            for file_path, (validation, referenced) in zip(files_to_check, results):
                 file_validations.append(validation)
                 
                 if validation.issues:
@@ -109,23 +128,23 @@ class ValidateStructureTool(BaseTool):
                 if validation.has_references:
                     all_references[str(file_path)] = validation.broken_references
                     
-                # Extract referenced files from content
-                referenced_files.update(
-                    self._extract_referenced_files(file_path, root_path)
-                )
+                referenced_files.update(referenced)
                 
             # Find orphaned files if requested
             orphaned_files = []
             if request.check_orphans:
-                all_file_paths = {str(f) for f in files_to_check}
+                # References are recorded as resolved paths, so compare those;
+                # files already resolved through the index were referenced
                 orphaned_files = [
-                    f for f in all_file_paths 
-                    if f not in referenced_files and not self._is_index_file(Path(f))
+                    str(f) for f in dict.fromkeys(files_to_check)
+                    if known_files[os.path.abspath(f)] is None
+                    and str(f.resolve()) not in referenced_files
+                    and not self._is_index_file(f)
                 ]
                 
                 # Add orphan issues
                 for orphan in orphaned_files:
-                    issue = ValidationIssue(
+                    issue = ValidationIssue.model_construct(
                         type="orphaned_file",
                         severity="warning",
                         file_path=orphan,
@@ -187,42 +206,49 @@ class ValidateStructureTool(BaseTool):
                 processing_time=time.time() - start_time
             )
             
-    async def _validate_file(
+    def _validate_file(
         self, 
         file_path: Path, 
         root_path: Path,
-        request: ValidateStructureRequest
-    ) -> FileValidation:
-        """Validate a single file."""
+        request: ValidateStructureRequest,
+        known_files: Dict[str, Optional[Path]]
+    ) -> Tuple[FileValidation, Set[str]]:
+        """Validate a single file.
+        
+        Also returns the resolved paths of the files it references.
+        """
         issues = []
         broken_references = []
         categories_found = []
+        referenced = set()
         
         try:
-            content = file_path.read_text(encoding='utf-8')
+            stat = file_path.stat()
+            parsed = parse_doc(str(file_path), stat.st_mtime_ns, stat.st_size)
             
             # Check for references
-            references = self._extract_references(content)
+            references = parsed.references
             has_references = len(references) > 0
             
-            # Validate references if requested
-            if request.check_references and references:
-                for ref in references:
-                    ref_path = self._resolve_reference(ref, file_path, root_path)
-                    if not ref_path or not ref_path.exists():
-                        broken_references.append(ref)
-                        issues.append(ValidationIssue(
-                            type="broken_reference",
-                            severity="error",
-                            file_path=str(file_path),
-                            message=f"Broken reference: {ref}",
-                            details={"reference": ref}
-                        ))
+            # Resolve each reference once to collect targets and find broken ones
+            for ref in references:
+                ref_path = self._resolve_reference(ref, file_path, root_path, known_files)
+                if ref_path:
+                    referenced.add(str(ref_path))
+                elif request.check_references:
+                    broken_references.append(ref)
+                    issues.append(ValidationIssue.model_construct(
+                        type="broken_reference",
+                        severity="error",
+                        file_path=str(file_path),
+                        message=f"Broken reference: {ref}",
+                        details={"reference": ref}
+                    ))
                         
             # Check for categories
-            categories_found = self._extract_categories(content)
+            categories_found = list(parsed.categories)
             if not categories_found:
-                issues.append(ValidationIssue(
+                issues.append(ValidationIssue.model_construct(
                     type="missing_category",
                     severity="warning",
                     file_path=str(file_path),
@@ -231,8 +257,8 @@ class ValidateStructureTool(BaseTool):
                 ))
                 
             # Check file structure
-            if not self._validate_file_structure(content):
-                issues.append(ValidationIssue(
+            if not parsed.has_structure:
+                issues.append(ValidationIssue.model_construct(
                     type="invalid_structure",
                     severity="warning",
                     file_path=str(file_path),
@@ -250,7 +276,7 @@ class ValidateStructureTool(BaseTool):
                 broken_references=broken_references,
                 categories_found=categories_found,
                 issues=issues
-            )
+            ), referenced
             
         except Exception as e:
             return FileValidation(
@@ -260,53 +286,22 @@ class ValidateStructureTool(BaseTool):
                 reference_count=0,
                 broken_references=[],
                 categories_found=[],
-                issues=[ValidationIssue(
+                issues=[ValidationIssue.model_construct(
                     type="read_error",
                     severity="error",
                     file_path=str(file_path),
                     message=f"Failed to read file: {str(e)}",
                     details={}
                 )]
-            )
-            
-    def _extract_references(self, content: str) -> List[str]:
-        """Extract all references from content."""
-        import re
-        references = []
-        
-        # Markdown links: [text](path)
-        md_links = re.findall(r'\[([^\]]+)\]\(([^)]+)\)', content)
-        references.extend([link[1] for link in md_links if not link[1].startswith('http')])
-        
-        # Reference-style links: [text][ref]
-        ref_links = re.findall(r'\[([^\]]+)\]\[([^\]]+)\]', content)
-        # Find corresponding definitions
-        for _, ref_id in ref_links:
-            ref_def = re.search(rf'\[{re.escape(ref_id)}\]:\s*(.+)', content)
-            if ref_def and not ref_def.group(1).startswith('http'):
-                references.append(ref_def.group(1))
-                
-        return references
-        
-    def _extract_referenced_files(self, file_path: Path, root_path: Path) -> Set[str]:
-        """Extract all files referenced by this file."""
-        referenced = set()
-        
-        try:
-            content = file_path.read_text(encoding='utf-8')
-            references = self._extract_references(content)
+            ), set()
             
-            for ref in references:
-                ref_path = self._resolve_reference(ref, file_path, root_path)
-                if ref_path and ref_path.exists():
-                    referenced.add(str(ref_path))
-                    
-        except Exception as e:
-            self._logger.error("extract_referenced_files_failed", error=str(e))
-            
-        return referenced
-        
-    def _resolve_reference(self, ref: str, source_file: Path, root_path: Path) -> Optional[Path]:
+    def _resolve_reference(
+        self,
+        ref: str,
+        source_file: Path,
+        root_path: Path,
+        known_files: Dict[str, Optional[Path]]
+    ) -> Optional[Path]:
         """Resolve a reference to an absolute path."""
         try:
             # Clean the reference
@@ -314,65 +309,26 @@ class ValidateStructureTool(BaseTool):
             if ref.startswith('#'):  # Internal anchor
                 return None
                 
-            # Try relative to source file
-            ref_path = source_file.parent / ref
-            if ref_path.exists():
-                return ref_path.resolve()
-                
-            # Try relative to root
-            ref_path = root_path / ref
-            if ref_path.exists():
-                return ref_path.resolve()
-                
-            # Try as absolute path
-            ref_path = Path(ref)
-            if ref_path.exists():
-                return ref_path.resolve()
-                
+            # Lexical lookups are only safe when ".." can't step out of a symlink
+            use_index = '..' not in Path(ref).parts
+            
+            # Try relative to source file, relative to root, then as absolute path
+            for ref_path in (source_file.parent / ref, root_path / ref, Path(ref)):
+                key = os.path.abspath(ref_path)
+                if use_index and key in known_files:
+                    resolved = known_files[key]
+                    if resolved is None:
+                        resolved = known_files[key] = ref_path.resolve()
+                    return resolved
+                    
+                if ref_path.exists():
+                    return ref_path.resolve()
+                    
             return None
             
         except Exception:
             return None
             
-    def _extract_categories(self, content: str) -> List[str]:
-        """Extract categories from content."""
-        categories = []
-        
-        # Look for category in frontmatter
-        if content.startswith("---"):
-            try:
-                import yaml
-                frontmatter_end = content.find("---", 3)
-                if frontmatter_end > 0:
-                    frontmatter = content[3:frontmatter_end]
-                    data = yaml.safe_load(frontmatter) or {}
-                    if "category" in data:
-                        categories.append(data["category"])
-                    if "categories" in data:
-                        categories.extend(data["categories"])
-            except:
-                pass
-                
-        # Look for category headers
-        import re
-        category_matches = re.findall(
-            r'(?:Category|Categories):\s*(.+)',
-            content, 
-            re.IGNORECASE
-        )
-        for match in category_matches:
-            categories.extend([c.strip() for c in match.split(',')])
-            
-        return list(set(categories))  # Remove duplicates
-        
-    def _validate_file_structure(self, content: str) -> bool:
-        """Validate that file follows expected structure."""
-        # Check for basic structure elements
-        has_title = content.strip().startswith('#') or '---' in content[:10]
-        has_content = len(content.strip()) > 50  # Arbitrary minimum
-        
-        return has_title and has_content
-        
     def _is_index_file(self, file_path: Path) -> bool:
         """Check if file is an index file."""
         index_names = ['index', 'readme', 'toc', 'contents']
@@ -388,7 +344,7 @@ class ValidateStructureTool(BaseTool):
         
         # Check if output directory exists
         if not expected_output_dir.exists():
-            issues.append(ValidationIssue(
+            issues.append(ValidationIssue.model_construct(
                 type="missing_directory",
                 severity="info",
                 file_path=str(expected_output_dir),
@@ -396,13 +352,11 @@ class ValidateStructureTool(BaseTool):
             ))
             
         # Check for expected category directories
-        from ...core.types import ExtractionCategory
-        
         if expected_output_dir.exists() and self.config.organization.group_by_category:
             for category in ExtractionCategory:
                 category_dir = expected_output_dir / category.value
                 if not category_dir.exists():
-                    issues.append(ValidationIssue(
+                    issues.append(ValidationIssue.model_construct(
                         type="missing_category_dir",
                         severity="info",
                         file_path=str(category_dir),
@@ -1,9 +1,11 @@
 """File monitoring implementation using watchdog."""
 
 import asyncio
+import codecs
+import stat as stat_module
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Set
-from dataclasses import dataclass
+from typing import BinaryIO, Callable, Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from watchdog.observers import Observer
 from watchdog.events import (
@@ -24,6 +26,95 @@ from ..core.types import EventType, WatchConfig
 
 logger = structlog.get_logger()
 
+# Bytes read per chunk when counting lines
+LINE_COUNT_CHUNK_SIZE = 1024 * 1024
+
+# Trailing bytes remembered to detect rewrites of an already counted prefix
+LINE_COUNT_MARKER_SIZE = 64
+
+
+@dataclass
+class _LineCount:
+    """Progress of an LF-only line count, resumable when a file grows."""
+    
+    size: int = 0
+    breaks: int = 0
+    tail_text: bool = False
+    decoder_state: Tuple[bytes, int] = (b'', 0)
+    marker: bytes = b''
+    
+    @property
+    def lines(self) -> int:
+        """Line count, including a final line without LF."""
+        return self.breaks + self.tail_text
+
+
+def _scan_lf(f: BinaryIO, count: _LineCount) -> bool:
+    """Continue ``count`` from the file's current position to its end.
+    
+    Returns False without finishing if a CR byte is found, since CR line
+    ends need the decoding counter.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+    decoder.setstate(count.decoder_state)
+    buf = bytearray(LINE_COUNT_CHUNK_SIZE)
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            break
+        if buf.find(b'\r', 0, n) >= 0:
+            return False
+        last_lf = buf.rfind(b'\n', 0, n)
+        if last_lf >= 0:
+            count.breaks += buf.count(b'\n', 0, n)
+            decoder.reset()
+            count.tail_text = bool(decoder.decode(buf[last_lf + 1:n]))
+        elif not count.tail_text:
+            # The final line counts once anything in it survives decoding
+            count.tail_text = bool(decoder.decode(buf[:n]))
+        count.size += n
+        
+    count.decoder_state = decoder.getstate()
+    f.seek(max(count.size - LINE_COUNT_MARKER_SIZE, 0))
+    count.marker = f.read(LINE_COUNT_MARKER_SIZE)
+    return True
+
+
+def _resume_line_count(f: BinaryIO, previous: _LineCount) -> Optional[_LineCount]:
+    """Return a copy of ``previous`` positioned to count appended bytes.
+    
+    Returns None when the bytes already counted appear to have changed.
+    """
+    f.seek(max(previous.size - LINE_COUNT_MARKER_SIZE, 0))
+    if f.read(len(previous.marker)) != previous.marker:
+        return None
+    f.seek(previous.size)
+    return replace(previous)
+
+
+def _count_lines_decoded(path: Path) -> int:
+    """Count lines by decoding chunks, treating LF, CRLF and CR as breaks."""
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+    breaks = 0
+    crlf = 0
+    last = ''
+    with open(path, 'rb') as f:
+        while True:
+            data = f.read(LINE_COUNT_CHUNK_SIZE)
+            chunk = decoder.decode(data, final=not data)
+            if chunk:
+                breaks += chunk.count('\n') + chunk.count('\r')
+                crlf += chunk.count('\r\n')
+                if last == '\r' and chunk[0] == '\n':
+                    crlf += 1
+                last = chunk[-1]
+            if not data:
+                break
+                
+    if last and last not in '\r\n':
+        breaks += 1
+    return breaks - crlf
+
 
 @dataclass
 class FileStatistics:
@@ -136,6 +227,7 @@ class FileMonitor(Monitor):
         # File statistics tracking
         self._file_stats: Dict[Path, FileStatistics] = {}
         self._growth_history: Dict[Path, List[Tuple[datetime, int]]] = {}
+        self._line_counts: Dict[Path, _LineCount] = {}
         
         # Thresholds
         self.size_threshold_lines = getattr(config, 'size_threshold_lines', 200)
@@ -242,6 +334,11 @@ class FileMonitor(Monitor):
                 threshold_violations = await self._check_thresholds(event.path, stats)
                 if threshold_violations:
                     await self._handle_threshold_violations(event.path, stats, threshold_violations)
+        elif event.type in ["deleted", "moved"]:
+            # A later file at either path must be counted from the start
+            self._line_counts.pop(event.path, None)
+            if event.old_path:
+                self._line_counts.pop(event.old_path, None)
                     
         self._logger.debug(
             "file_event",
@@ -310,18 +407,22 @@ class FileMonitor(Monitor):
     async def _calculate_file_statistics(self, path: Path) -> Optional[FileStatistics]:
         """Calculate statistics for a file."""
         try:
-            if not path.exists() or not path.is_file():
+            # Blocking stat and read run in the default executor
+            loop = asyncio.get_running_loop()
+            try:
+                stat = await loop.run_in_executor(None, path.stat)
+            except OSError:
+                return None
+            if not stat_module.S_ISREG(stat.st_mode):
                 return None
                 
-            stat = path.stat()
             size = stat.st_size
             modified_time = datetime.fromtimestamp(stat.st_mtime)
             
             # Count lines
             line_count = 0
             try:
-                with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                    line_count = sum(1 for _ in f)
+                line_count = await loop.run_in_executor(None, self._count_lines, path, size)
             except Exception as e:
                 self._logger.warning("error_counting_lines", path=str(path), error=str(e))
                 
@@ -345,6 +446,25 @@ class FileMonitor(Monitor):
             self._logger.error("error_calculating_statistics", path=str(path), error=str(e))
             return None
             
+    def _count_lines(self, path: Path, size: int) -> int:
+        """Count lines, reading only the bytes appended since the last count."""
+        previous = self._line_counts.get(path)
+        with open(path, 'rb', buffering=0) as f:
+            # Only growth is treated as an append; anything else is recounted
+            count = None
+            if previous is not None and previous.size < size:
+                count = _resume_line_count(f, previous)
+            if count is None:
+                count = _LineCount()
+                f.seek(0)
+                
+            if _scan_lf(f, count):
+                self._line_counts[path] = count
+                return count.lines
+                
+        self._line_counts.pop(path, None)
+        return _count_lines_decoded(path)
+        
     def _calculate_growth_rate(self, path: Path, current_lines: int) -> float:
         """Calculate file growth rate in lines per hour."""
         if path not in self._growth_history or len(self._growth_history[path]) < 2:
@@ -8,6 +8,7 @@ import structlog
 
 from ..core.base import Component, EventBus
 from ..core.types import EventType, WatchConfig, Document
+from ..utils.files import iter_matching_files
 from .file_monitor import FileMonitor
 
 logger = structlog.get_logger()
@@ -80,13 +81,11 @@ class DirectoryWatcher(Component):
             if watch_path.is_file():
                 files = [watch_path]
             else:
-                files = []
-                for pattern in self.config.patterns:
-                    if self.config.recursive:
-                        files.extend(watch_path.rglob(pattern))
-                    else:
-                        files.extend(watch_path.glob(pattern))
-                        
+                # One walk for all patterns, so each file is queued once
+                files = iter_matching_files(
+                    watch_path, self.config.patterns, self.config.recursive
+                )
+                
             # Queue files for processing
             for file_path in files:
                 if file_path.is_file() and not self._should_ignore(file_path):
@@ -223,6 +222,10 @@ class DirectoryWatcher(Component):
         """Get list of processed files."""
         return list(self._processed_files)
         
+    def get_processed_count(self) -> int:
+        """Get the number of processed files without copying them."""
+        return len(self._processed_files)
+        
     def get_queue_size(self) -> int:
         """Get the size of the processing queue."""
         return self._processing_queue.qsize()
\ No newline at end of file
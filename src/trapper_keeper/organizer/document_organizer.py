@@ -1,24 +1,26 @@
 """Document organization implementation."""
 
+import asyncio
 import json
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
-from collections import defaultdict
 import aiofiles
 import structlog
 
 from ..core.base import Organizer, EventBus
 from ..core.types import (
     ExtractedContent,
-    ExtractionCategory,
     OrganizationConfig,
     EventType
 )
 
 logger = structlog.get_logger()
 
+# Below this many output files, writing them one by one is cheaper than fanning out
+CONCURRENT_WRITE_THRESHOLD = 4
+
 
 class DocumentOrganizer(Organizer):
     """Organizes extracted content into structured output."""
@@ -53,29 +55,10 @@ class DocumentOrganizer(Organizer):
         )
         
         try:
-            organized = defaultdict(list)
+            organized: Dict[str, List[ExtractedContent]] = {}
+            self.organize_batch(contents, organized)
+            self.sort_groups(organized)
             
-            if self.config.group_by_category:
-                # Group by category
-                for content in contents:
-                    category_key = content.category
-                    if isinstance(category_key, ExtractionCategory):
-                        category_key = category_key.value
-                    organized[category_key].append(content)
-                    
-            elif self.config.group_by_document:
-                # Group by source document
-                for content in contents:
-                    organized[content.document_id].append(content)
-                    
-            else:
-                # Single group
-                organized["all"] = contents
-                
-            # Sort contents within each group by importance
-            for group in organized.values():
-                group.sort(key=lambda x: x.importance, reverse=True)
-                
             self._logger.info(
                 "content_organized",
                 groups=len(organized),
@@ -90,7 +73,7 @@ class DocumentOrganizer(Organizer):
                 }
             )
             
-            return dict(organized)
+            return organized
             
         except Exception as e:
             self._logger.error("organization_failed", error=str(e))
@@ -102,41 +85,93 @@ class DocumentOrganizer(Organizer):
             
             raise
             
+    def organize_batch(
+        self,
+        contents: List[ExtractedContent],
+        organized: Dict[str, List[ExtractedContent]]
+    ) -> None:
+        """Add a batch of contents to an in-progress grouping.
+        
+        Lets callers group results as they arrive; call sort_groups once
+        all batches are in.
+        """
+        if self.config.group_by_category:
+            # Group by category
+            for content in contents:
+                organized.setdefault(content.category_str, []).append(content)
+                
+        elif self.config.group_by_document:
+            # Group by source document
+            for content in contents:
+                organized.setdefault(content.document_id, []).append(content)
+                
+        else:
+            # Single group
+            organized.setdefault("all", []).extend(contents)
+            
+    def sort_groups(self, organized: Dict[str, List[ExtractedContent]]) -> None:
+        """Sort contents within each group by importance."""
+        for group in organized.values():
+            group.sort(key=lambda x: x.importance, reverse=True)
+            
     async def save(
         self,
         organized_content: Dict[str, List[ExtractedContent]],
-        output_dir: Optional[Path] = None
-    ) -> None:
-        """Save organized content to output directory."""
+        output_dir: Optional[Path] = None,
+        output_format: Optional[str] = None
+    ) -> List[Path]:
+        """Save organized content to output directory.
+        
+        Returns the paths of the category files written.
+        """
         output_dir = output_dir or self.config.output_dir
+        output_format = output_format or self.config.format
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Save based on format
-        if self.config.format == "markdown":
-            await self._save_as_markdown(organized_content, output_dir)
-        elif self.config.format == "json":
-            await self._save_as_json(organized_content, output_dir)
-        elif self.config.format == "yaml":
-            await self._save_as_yaml(organized_content, output_dir)
+        # Render based on format
+        if output_format == "markdown":
+            files = self._render_markdown(organized_content, output_dir)
+        elif output_format == "json":
+            files = self._render_json(organized_content, output_dir)
+        elif output_format == "yaml":
+            files = self._render_yaml(organized_content, output_dir)
         else:
-            raise ValueError(f"Unsupported format: {self.config.format}")
+            raise ValueError(f"Unsupported format: {output_format}")
             
+        await self._write_files(files)
+        
         # Create index if requested
         if self.config.create_index:
-            await self._create_index(organized_content, output_dir)
+            await self._create_index(organized_content, output_dir, output_format)
             
         self._logger.info(
             "content_saved",
             output_dir=str(output_dir),
-            format=self.config.format
+            format=output_format
         )
         
-    async def _save_as_markdown(
+        return [filepath for filepath, _ in files]
+        
+    async def _write_files(self, files: List[Tuple[Path, str]]) -> None:
+        """Write rendered files, concurrently when there are several."""
+        if len(files) < CONCURRENT_WRITE_THRESHOLD:
+            for filepath, text in files:
+                await self._write_file(filepath, text)
+        else:
+            await asyncio.gather(*(self._write_file(filepath, text) for filepath, text in files))
+            
+    async def _write_file(self, filepath: Path, text: str) -> None:
+        """Write a single UTF-8 text file."""
+        async with aiofiles.open(filepath, 'w', encoding='utf-8') as f:
+            await f.write(text)
+            
+    def _render_markdown(
         self,
         organized_content: Dict[str, List[ExtractedContent]],
         output_dir: Path
-    ) -> None:
-        """Save organized content as markdown files."""
+    ) -> List[Tuple[Path, str]]:
+        """Render organized content as markdown files."""
+        files = []
         for category, contents in organized_content.items():
             # Create category file
             filename = f"{self._sanitize_filename(category)}.md"
@@ -154,7 +189,7 @@ class DocumentOrganizer(Organizer):
                 lines.append(f"## {content.title}\n")
                 
                 if self.config.include_metadata:
-                    lines.append(f"- **Category**: {content.category}")
+                    lines.append(f"- **Category**: {content.category_str}")
                     lines.append(f"- **Importance**: {content.importance:.2f}")
                     lines.append(f"- **Document**: {content.document_id}")
                     if content.tags:
@@ -164,16 +199,17 @@ class DocumentOrganizer(Organizer):
                 lines.append(content.content)
                 lines.append("\n---\n")
                 
-            # Write file
-            async with aiofiles.open(filepath, 'w', encoding='utf-8') as f:
-                await f.write('\n'.join(lines))
-                
-    async def _save_as_json(
+            files.append((filepath, '\n'.join(lines)))
+            
+        return files
+        
+    def _render_json(
         self,
         organized_content: Dict[str, List[ExtractedContent]],
         output_dir: Path
-    ) -> None:
-        """Save organized content as JSON files."""
+    ) -> List[Tuple[Path, str]]:
+        """Render organized content as JSON files."""
+        files = []
         for category, contents in organized_content.items():
             filename = f"{self._sanitize_filename(category)}.json"
             filepath = output_dir / filename
@@ -198,7 +234,7 @@ class DocumentOrganizer(Organizer):
                 
                 if self.config.include_metadata:
                     item.update({
-                        "category": content.category.value if isinstance(content.category, ExtractionCategory) else content.category,
+                        "category": content.category_str,
                         "tags": list(content.tags),
                         "source_section": content.source_section,
                         "metadata": content.metadata
@@ -206,16 +242,17 @@ class DocumentOrganizer(Organizer):
                     
                 data["contents"].append(item)
                 
-            # Write file
-            async with aiofiles.open(filepath, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(data, indent=2, ensure_ascii=False))
-                
-    async def _save_as_yaml(
+            files.append((filepath, json.dumps(data, indent=2, ensure_ascii=False)))
+            
+        return files
+        
+    def _render_yaml(
         self,
         organized_content: Dict[str, List[ExtractedContent]],
         output_dir: Path
-    ) -> None:
-        """Save organized content as YAML files."""
+    ) -> List[Tuple[Path, str]]:
+        """Render organized content as YAML files."""
+        files = []
         for category, contents in organized_content.items():
             filename = f"{self._sanitize_filename(category)}.yaml"
             filepath = output_dir / filename
@@ -240,7 +277,7 @@ class DocumentOrganizer(Organizer):
                 
                 if self.config.include_metadata:
                     item.update({
-                        "category": content.category.value if isinstance(content.category, ExtractionCategory) else content.category,
+                        "category": content.category_str,
                         "tags": list(content.tags),
                         "source_section": content.source_section,
                         "metadata": content.metadata
@@ -248,14 +285,15 @@ class DocumentOrganizer(Organizer):
                     
                 data["contents"].append(item)
                 
-            # Write file
-            async with aiofiles.open(filepath, 'w', encoding='utf-8') as f:
-                await f.write(yaml.dump(data, default_flow_style=False, allow_unicode=True))
+            files.append((filepath, yaml.dump(data, default_flow_style=False, allow_unicode=True)))
+            
+        return files
                 
     async def _create_index(
         self,
         organized_content: Dict[str, List[ExtractedContent]],
-        output_dir: Path
+        output_dir: Path,
+        output_format: str
     ) -> None:
         """Create an index file for all organized content."""
         index_path = output_dir / "index.md"
@@ -270,7 +308,7 @@ class DocumentOrganizer(Organizer):
         total_contents = 0
         for category, contents in sorted(organized_content.items()):
             total_contents += len(contents)
-            filename = f"{self._sanitize_filename(category)}.{self.config.format}"
+            filename = f"{self._sanitize_filename(category)}.{output_format}"
             lines.append(f"- [{category}](./{filename}) ({len(contents)} items)")
             
         lines.append(f"\n**Total items**: {total_contents}\n")
@@ -1,6 +1,13 @@
 """Document parsing for Trapper Keeper."""
 
+from .document_cache import clear_parse_cache, parse_file_cached
 from .markdown_parser import MarkdownParser
 from .parser_factory import ParserFactory, get_parser
 
-__all__ = ["MarkdownParser", "ParserFactory", "get_parser"]
\ No newline at end of file
+__all__ = [
+    "MarkdownParser",
+    "ParserFactory",
+    "clear_parse_cache",
+    "get_parser",
+    "parse_file_cached",
+]
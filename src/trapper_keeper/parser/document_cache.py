@@ -0,0 +1,63 @@
+"""Cache of parsed documents shared across tool invocations."""
+
+import asyncio
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Tuple
+
+from ..core.base import Parser
+from ..core.types import Document
+from ..utils.files import read_text
+
+# Maximum number of parsed documents kept in the cache
+PARSE_CACHE_SIZE = 32
+
+# path -> (mtime_ns, size, document), least recently used first
+_parse_cache: OrderedDict = OrderedDict()
+
+# (path, mtime_ns, size) -> parse in progress, shared by concurrent callers
+_pending: Dict[Tuple[str, int, int], asyncio.Future] = {}
+
+
+async def _read_and_parse(path: Path, parser: Parser) -> Document:
+    """Read and parse a file."""
+    content = await read_text(path)
+    return await parser.parse(content, path)
+
+
+async def parse_file_cached(path: Path, parser: Parser, stat: os.stat_result) -> Document:
+    """Parse a file, reusing the previous parse while its mtime and size are unchanged.
+
+    ``stat`` is the caller's stat of ``path``. The returned document is
+    shared between callers and must not be modified.
+    """
+    path_str = os.fspath(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    entry = _parse_cache.get(path_str)
+    if entry is not None and entry[:2] == signature:
+        _parse_cache.move_to_end(path_str)
+        return entry[2]
+
+    key = (path_str, signature[0], signature[1])
+    task = _pending.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_read_and_parse(path, parser))
+        _pending[key] = task
+        task.add_done_callback(lambda _: _pending.pop(key, None))
+
+    # Shield so one cancelled caller doesn't abort the parse for the others
+    document = await asyncio.shield(task)
+
+    _parse_cache[path_str] = (signature[0], signature[1], document)
+    _parse_cache.move_to_end(path_str)
+    if len(_parse_cache) > PARSE_CACHE_SIZE:
+        _parse_cache.popitem(last=False)
+
+    return document
+
+
+def clear_parse_cache() -> None:
+    """Drop all cached documents."""
+    _parse_cache.clear()
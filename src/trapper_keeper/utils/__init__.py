@@ -1,5 +1,14 @@
 """Utility functions for Trapper Keeper."""
 
+from .files import compile_patterns, iter_matching_files, read_text, write_text
+from .frontmatter import load_frontmatter
 from .metrics import MetricsCollector
 
-__all__ = ["MetricsCollector"]
\ No newline at end of file
+__all__ = [
+    "MetricsCollector",
+    "compile_patterns",
+    "iter_matching_files",
+    "load_frontmatter",
+    "read_text",
+    "write_text",
+]
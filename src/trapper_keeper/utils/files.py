@@ -0,0 +1,65 @@
+"""Filesystem helpers for Trapper Keeper."""
+
+import os
+import re
+from fnmatch import translate
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, List, Pattern, Tuple
+
+import aiofiles
+
+
+@lru_cache(maxsize=64)
+def compile_patterns(patterns: Tuple[str, ...]) -> Pattern[str]:
+    """Compile glob patterns into one case-sensitive regex.
+    
+    Matching a name against the combined regex is equivalent to
+    ``any(fnmatchcase(name, p) for p in patterns)`` but needs a single call.
+    """
+    return re.compile("|".join(translate(p) for p in patterns))
+
+
+def iter_matching_files(
+    directory: Path,
+    patterns: List[str],
+    recursive: bool = True
+) -> Iterator[Path]:
+    """Yield files under a directory whose names match any of the patterns.
+    
+    Walks the tree once with ``os.scandir`` regardless of how many patterns
+    are given, so each file is yielded at most once. Directory entries are
+    classified from the cached dirent data instead of a separate ``stat()``
+    per path. Symlinked directories are not followed, matching ``rglob``.
+    """
+    if not patterns:
+        return
+        
+    matches = compile_patterns(tuple(patterns)).match
+    pending = [os.fspath(directory)]
+    
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            pending.append(entry.path)
+                    elif entry.is_file() and matches(entry.name):
+                        yield Path(entry.path)
+        except OSError:
+            # Unreadable or vanished directory - skip it like rglob does
+            continue
+
+
+async def read_text(path: Path) -> str:
+    """Read a UTF-8 text file without blocking the event loop."""
+    async with aiofiles.open(path, 'r', encoding='utf-8') as f:
+        return await f.read()
+
+
+async def write_text(path: Path, text: str) -> None:
+    """Write a UTF-8 text file without blocking the event loop."""
+    async with aiofiles.open(path, 'w', encoding='utf-8') as f:
+        await f.write(text)
@@ -0,0 +1,71 @@
+"""Frontmatter helpers for Trapper Keeper."""
+
+import re
+from typing import Any, Dict, List, Optional, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+# A plain word-like scalar that YAML always reads back as the same string
+_PLAIN_VALUE = r'[A-Za-z][\w \-]*?'
+_SIMPLE_LINE_RE = re.compile(
+    rf'([A-Za-z_][\w\-]*): +(?:({_PLAIN_VALUE})|\[((?: *{_PLAIN_VALUE} *,)* *{_PLAIN_VALUE}) *\]) *'
+)
+
+# Plain words that YAML resolves to booleans or null instead of strings
+_SPECIAL_WORDS = frozenset({
+    "yes", "no", "true", "false", "on", "off", "null",
+})
+
+
+def _plain_string(value: str) -> Optional[str]:
+    """Return a plain scalar as a string, or None if YAML would read it otherwise."""
+    value = value.strip()
+    if value.lower() in _SPECIAL_WORDS:
+        return None
+    return value
+
+
+def _parse_simple(text: str) -> Optional[Dict[str, Union[str, List[str]]]]:
+    """Parse flat ``key: word`` / ``key: [a, b]`` frontmatter, or return None."""
+    data: Dict[str, Union[str, List[str]]] = {}
+    for line in text.split('\n'):
+        if not line.strip():
+            continue
+        match = _SIMPLE_LINE_RE.fullmatch(line)
+        if not match:
+            return None
+
+        key, scalar, items = match.groups()
+        if _plain_string(key) is None:
+            return None
+        if scalar is not None:
+            value = _plain_string(scalar)
+            if value is None:
+                return None
+            data[key] = value
+        else:
+            values = [_plain_string(item) for item in items.split(',')]
+            if None in values:
+                return None
+            data[key] = values
+
+    return data or None
+
+
+def load_frontmatter(text: str) -> Any:
+    """Parse frontmatter YAML.
+
+    Flat ``key: value`` and ``key: [a, b]`` blocks of plain words are parsed
+    directly; anything else goes through PyYAML's safe loader, using the
+    libyaml C implementation when it is available. Well-formed input gives
+    the same result as ``yaml.safe_load(text)``.
+    """
+    data = _parse_simple(text)
+    if data is not None:
+        return data
+    return yaml.load(text, Loader=_SafeLoader)
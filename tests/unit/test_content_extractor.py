@@ -367,6 +367,26 @@ class TestContentExtractor:
         for e in extracted:
             assert e.source_section in ["1", "2", "3", None]
     
+    @pytest.mark.asyncio
+    async def test_nested_sections_extracted_once(self, extractor):
+        """Test that child sections are not extracted a second time."""
+        body = "Security audit of authentication, encryption and password handling. " * 3
+        parent = DocumentSection(id="1", title="Security", content=body, level=1)
+        child = DocumentSection(id="2", title="Auth", content=body, level=2, parent_id="1")
+        parent.children.append(child)
+        doc = Document(
+            id="test-nested",
+            type=DocumentType.MARKDOWN,
+            content="",
+            sections=[parent, child],
+        )
+        
+        await extractor.initialize()
+        extracted = await extractor.extract(doc)
+        
+        sources = [e.source_section for e in extracted if e.source_section]
+        assert len(sources) == len(set(sources))
+    
     @pytest.mark.asyncio
     async def test_category_detection_keywords(self, extractor):
         """Test category detection based on keywords."""
@@ -0,0 +1,70 @@
+"""Unit tests for the parsed document cache."""
+
+import asyncio
+import os
+from unittest.mock import AsyncMock
+import pytest
+import pytest_asyncio
+
+from trapper_keeper.parser import MarkdownParser
+from trapper_keeper.parser.document_cache import clear_parse_cache, parse_file_cached
+
+
+class TestParseFileCached:
+    """Test parse_file_cached helper."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        """Start and end each test with an empty cache."""
+        clear_parse_cache()
+        yield
+        clear_parse_cache()
+
+    @pytest_asyncio.fixture
+    async def parser(self, mock_event_bus):
+        """Create an initialized markdown parser."""
+        parser = MarkdownParser(mock_event_bus)
+        await parser.initialize()
+        return parser
+
+    @pytest.mark.asyncio
+    async def test_unchanged_file_reuses_document(self, parser, tmp_path):
+        """Test an unchanged file is parsed only once."""
+        path = tmp_path / "doc.md"
+        path.write_text("# Title\n\nBody")
+
+        first = await parse_file_cached(path, parser, path.stat())
+        second = await parse_file_cached(path, parser, path.stat())
+
+        assert second is first
+
+    @pytest.mark.asyncio
+    async def test_modified_file_is_reparsed(self, parser, tmp_path):
+        """Test a changed file is parsed again."""
+        path = tmp_path / "doc.md"
+        path.write_text("# Title\n\nBody")
+        first = await parse_file_cached(path, parser, path.stat())
+
+        path.write_text("# Title\n\nLonger body")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = await parse_file_cached(path, parser, path.stat())
+
+        assert second is not first
+        assert "Longer body" in second.content
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_parse(self, parser, tmp_path):
+        """Test concurrent requests for one file run a single parse."""
+        path = tmp_path / "doc.md"
+        path.write_text("# Title\n\nBody")
+        parser.parse = AsyncMock(wraps=parser.parse)
+        stat = path.stat()
+
+        first, second = await asyncio.gather(
+            parse_file_cached(path, parser, stat),
+            parse_file_cached(path, parser, stat),
+        )
+
+        assert first is second
+        assert parser.parse.await_count == 1
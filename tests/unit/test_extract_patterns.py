@@ -0,0 +1,51 @@
+"""Unit tests for extract_content pattern compilation."""
+
+import re
+
+import pytest
+
+from trapper_keeper.mcp.tools.extract import _compile_ci
+
+
+def _matches(compiled, text):
+    """Return whether any compiled pattern matches the text."""
+    return any(pattern.search(text) for pattern in compiled)
+
+
+class TestCompileCi:
+    """Test _compile_ci helper."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        """Start each test with an empty compile cache."""
+        _compile_ci.cache_clear()
+
+    def test_plain_patterns_are_combined(self):
+        """Test simple patterns become one case-insensitive alternation."""
+        compiled = _compile_ci(("api key", r"token\s+\d+", "a|b"))
+
+        assert len(compiled) == 1
+        assert _matches(compiled, "Store the API KEY here")
+        assert _matches(compiled, "token  42")
+        assert _matches(compiled, "b")
+        assert not _matches(compiled, "xyz")
+
+    @pytest.mark.parametrize("patterns, text", [
+        ((r"(y)", r"(a)\1"), "aa"),
+        ((r"x", r"(?P<q>a)(?P=q)"), "aa"),
+        ((r"(y)", r"(a)?(?(1)b|c)"), "ab"),
+        ((r"x", r"(?P<n>a)?(?(n)b|c)"), "c"),
+        ((r"x", r"(?s)a.b"), "a\nb"),
+        ((r"x", r"(?x) a b "), "ab"),
+    ])
+    def test_unsafe_patterns_are_compiled_separately(self, patterns, text):
+        """Test group references, conditionals and inline flags keep their meaning."""
+        compiled = _compile_ci(patterns)
+
+        assert len(compiled) == len(patterns)
+        assert _matches(compiled, text)
+
+    def test_invalid_pattern_raises(self):
+        """Test an invalid pattern is reported rather than skipped."""
+        with pytest.raises(re.error):
+            _compile_ci(("ok", "(unclosed"))
@@ -0,0 +1,62 @@
+"""Unit tests for filesystem helpers."""
+
+from fnmatch import fnmatchcase
+from pathlib import Path
+import pytest
+
+from trapper_keeper.utils.files import compile_patterns, iter_matching_files
+
+
+class TestIterMatchingFiles:
+    """Test iter_matching_files helper."""
+    
+    @pytest.fixture
+    def tree(self, tmp_path):
+        """Create a small directory tree."""
+        (tmp_path / "a.md").write_text("a")
+        (tmp_path / "b.txt").write_text("b")
+        (tmp_path / "c.py").write_text("c")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "d.md").write_text("d")
+        (tmp_path / "sub" / "nested.md").mkdir()  # directory named like a match
+        return tmp_path
+    
+    def test_recursive_matches_all_patterns(self, tree):
+        """Test recursive walk matches every pattern once."""
+        found = sorted(p.relative_to(tree) for p in iter_matching_files(tree, ["*.md", "*.txt"]))
+        
+        assert found == [Path("a.md"), Path("b.txt"), Path("sub/d.md")]
+    
+    def test_non_recursive(self, tree):
+        """Test non-recursive walk stays in the top directory."""
+        found = sorted(p.name for p in iter_matching_files(tree, ["*.md"], recursive=False))
+        
+        assert found == ["a.md"]
+    
+    def test_overlapping_patterns_yield_once(self, tree):
+        """Test a file matching several patterns is yielded once."""
+        found = list(iter_matching_files(tree, ["*.md", "a.*"], recursive=False))
+        
+        assert found == [tree / "a.md"]
+    
+    def test_missing_directory(self, tmp_path):
+        """Test a missing directory yields nothing."""
+        assert list(iter_matching_files(tmp_path / "missing", ["*.md"])) == []
+
+
+class TestCompilePatterns:
+    """Test compile_patterns helper."""
+    
+    @pytest.mark.parametrize("name", ["a.md", "A.MD", "ab.rst", "README", "README.bak", "x.txt.old", ".md"])
+    def test_matches_like_fnmatchcase(self, name):
+        """Test the combined regex agrees with fnmatchcase."""
+        patterns = ("*.md", "[ab]?.rst", "README")
+        
+        expected = any(fnmatchcase(name, p) for p in patterns)
+        assert bool(compile_patterns(patterns).match(name)) == expected
+        
+    def test_empty_patterns_match_nothing(self, tmp_path):
+        """Test a walk with no patterns yields no files."""
+        (tmp_path / "a.md").write_text("a")
+        
+        assert list(iter_matching_files(tmp_path, [])) == []
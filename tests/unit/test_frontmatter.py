@@ -0,0 +1,39 @@
+"""Unit tests for frontmatter helpers."""
+
+import pytest
+import yaml
+
+from trapper_keeper.utils.frontmatter import load_frontmatter
+
+
+class TestLoadFrontmatter:
+    """Test load_frontmatter helper."""
+    
+    @pytest.mark.parametrize("text", [
+        "",
+        "\n",
+        "title: My Document\ncategory: Security\n",
+        "categories: [API, Setup]\n",
+        "categories: [ API ,Setup Guide ]\ntags: [one]\n",
+        "name: first\nname: second\n",
+        "draft: true\n",
+        "enabled: Yes\n",
+        "value: null\n",
+        "on: now\n",
+        "count: 3\n",
+        "version: v1_2-beta\n",
+        "title: 'Quoted: text'\n",
+        "title: Text # comment\n",
+        "categories:\n  - API\n  - Setup\n",
+        "nested:\n  key: value\n",
+        "when: 2024-01-01\n",
+        "empty:\n",
+    ])
+    def test_matches_yaml_safe_load(self, text):
+        """Test results are identical to yaml.safe_load."""
+        assert load_frontmatter(text) == yaml.safe_load(text)
+        
+    def test_invalid_yaml_raises(self):
+        """Test malformed frontmatter still raises a YAML error."""
+        with pytest.raises(yaml.YAMLError):
+            load_frontmatter("key: [unclosed\n")
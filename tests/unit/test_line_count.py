@@ -0,0 +1,65 @@
+"""Unit tests for file line counting."""
+
+import pytest
+
+from trapper_keeper.core.types import WatchConfig
+from trapper_keeper.monitoring import file_monitor
+from trapper_keeper.monitoring.file_monitor import FileMonitor, _count_lines_decoded
+
+
+@pytest.mark.parametrize("data", [
+    b"",
+    b"one line",
+    b"Line 1\nLine 2\nLine 3\n",
+    b"windows\r\nline endings\r\n",
+    b"old mac\rline endings",
+    b"mixed\n\r\n\r\n\rend",
+    "unicode café\nnaïve\n".encode("utf-8"),
+    b"invalid \xff bytes\r\xff\nignored",
+    b"trailing invalid byte\n\xff",
+    b"truncated character\n\xc3",
+])
+def test_count_lines_matches_text_iteration(tmp_path, monkeypatch, data):
+    """Test counts agree with iterating the file in text mode, across chunk boundaries."""
+    path = tmp_path / "file.txt"
+    path.write_bytes(data)
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        expected = sum(1 for _ in f)
+
+    for chunk_size in (1, 2, 3, 1024):
+        monkeypatch.setattr(file_monitor, "LINE_COUNT_CHUNK_SIZE", chunk_size)
+        monitor = FileMonitor(WatchConfig(paths=[tmp_path]))
+        assert monitor._count_lines(path, len(data)) == expected
+        assert _count_lines_decoded(path) == expected
+
+
+class TestIncrementalLineCount:
+    """Test FileMonitor line counts across appends."""
+
+    @pytest.fixture
+    def monitor(self, tmp_path):
+        """Create a file monitor."""
+        return FileMonitor(WatchConfig(paths=[tmp_path]))
+
+    def test_appended_lines_are_added(self, monitor, tmp_path):
+        """Test growth of a file reads only the appended bytes."""
+        path = tmp_path / "log.txt"
+        path.write_bytes(b"one\ntwo")
+        assert monitor._count_lines(path, path.stat().st_size) == 2
+
+        with open(path, 'ab') as f:
+            f.write(b" continued\nthree\n")
+        assert monitor._count_lines(path, path.stat().st_size) == 3
+        assert monitor._line_counts[path].size == path.stat().st_size
+
+    def test_rewritten_file_is_recounted(self, monitor, tmp_path):
+        """Test a truncated or rewritten file is counted from the start."""
+        path = tmp_path / "log.txt"
+        path.write_bytes(b"one\ntwo\nthree\n")
+        monitor._count_lines(path, path.stat().st_size)
+
+        path.write_bytes(b"single line")
+        assert monitor._count_lines(path, path.stat().st_size) == 1
+
+        path.write_bytes(b"new\ncontent\nthat is longer\n")
+        assert monitor._count_lines(path, path.stat().st_size) == 3
@@ -0,0 +1,181 @@
+"""Unit tests for the processing orchestrator."""
+
+import multiprocessing
+import os
+import shutil
+import signal
+
+import pytest
+import pytest_asyncio
+
+from trapper_keeper.core.base import EventBus
+from trapper_keeper.core.types import EventType, ProcessingOverrides, TrapperKeeperConfig
+from trapper_keeper.mcp import orchestrator as orchestrator_module
+from trapper_keeper.mcp.orchestrator import ProcessingOrchestrator
+
+
+SAMPLE_DOCUMENT = (
+    "# Service Guide\n\n"
+    "## API Endpoints\n\n"
+    "GET /users returns the user list. IMPORTANT: authentication is required.\n\n"
+    "```python\nprint('hello')\n```\n\n"
+    "See the [reference docs](https://example.com/docs).\n"
+)
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Create a configuration that saves output under tmp_path."""
+    config = TrapperKeeperConfig()
+    config.processing.min_importance = 0.0
+    config.organization.output_dir = tmp_path / "output"
+    return config
+
+
+@pytest.fixture
+def event_bus():
+    """Create a real event bus."""
+    return EventBus()
+
+
+@pytest_asyncio.fixture
+async def orchestrator(config, event_bus):
+    """Create an initialized orchestrator and shut its pool down afterwards."""
+    orchestrator = ProcessingOrchestrator(config, event_bus)
+    await orchestrator.initialize()
+    yield orchestrator
+    orchestrator.close_process_pool()
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Write the sample document."""
+    path = tmp_path / "guide.md"
+    path.write_text(SAMPLE_DOCUMENT, encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    """Count parser lookups, which happen once per uncached processing run."""
+    calls = []
+    get_parser = orchestrator_module.get_parser
+
+    def counting_get_parser(path, event_bus=None):
+        calls.append(path)
+        return get_parser(path, event_bus)
+
+    monkeypatch.setattr(orchestrator_module, "get_parser", counting_get_parser)
+    return calls
+
+
+class TestResultCache:
+    """Test reuse of processing results for unchanged files."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_file_is_not_reparsed(self, orchestrator, source, parse_calls):
+        """Test the same mtime and size reuse the cached extraction."""
+        first = await orchestrator.process_file(source)
+        second = await orchestrator.process_file(source)
+
+        assert len(parse_calls) == 1
+        assert second.success
+        assert second.document_id == first.document_id
+        assert second.extracted_contents == first.extracted_contents
+
+    @pytest.mark.asyncio
+    async def test_changed_file_is_reprocessed(self, orchestrator, source, parse_calls):
+        """Test a new mtime or size misses the cache."""
+        first = await orchestrator.process_file(source)
+
+        stat = source.stat()
+        source.write_text(SAMPLE_DOCUMENT.replace("API Endpoints", "Endpoints"), encoding='utf-8')
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = await orchestrator.process_file(source)
+
+        assert len(parse_calls) == 2
+        assert second.document_id != first.document_id
+
+    @pytest.mark.asyncio
+    async def test_results_are_keyed_on_overrides(self, orchestrator, source, parse_calls):
+        """Test different overrides miss the cache and equal ones hit it."""
+        overrides = ProcessingOverrides(output_format="json")
+
+        await orchestrator.process_file(source)
+        await orchestrator.process_file(source, overrides=overrides)
+        await orchestrator.process_file(source, overrides=ProcessingOverrides(output_format="json"))
+
+        assert len(parse_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_still_saves_and_publishes(
+        self, orchestrator, config, event_bus, source, parse_calls
+    ):
+        """Test a hit rewrites deleted output and publishes a completion event."""
+        completions = event_bus.subscribe(EventType.PROCESSING_COMPLETED)
+        output_dir = config.organization.output_dir
+
+        first = await orchestrator.process_file(source)
+        saved = sorted(p.relative_to(output_dir) for p in output_dir.rglob("*") if p.is_file())
+        shutil.rmtree(output_dir)
+
+        second = await orchestrator.process_file(source)
+        resaved = sorted(p.relative_to(output_dir) for p in output_dir.rglob("*") if p.is_file())
+
+        assert len(parse_calls) == 1
+        assert saved
+        assert resaved == saved
+        assert completions.qsize() == 2
+        assert second.document_id == first.document_id
+
+
+class TestProcessFileInPool:
+    """Test processing files in the worker process pool."""
+
+    @pytest.mark.asyncio
+    async def test_pool_result_matches_in_process_result(self, orchestrator, source):
+        """Test a file run through the pool extracts the same content."""
+        in_process = await orchestrator.process_file(source)
+        orchestrator.clear_cache()
+
+        pooled = await orchestrator.process_file_in_pool(source)
+
+        assert pooled.success, pooled.errors
+        assert pooled.document_id
+        assert [c.title for c in pooled.extracted_contents] == [
+            c.title for c in in_process.extracted_contents
+        ]
+        assert pooled.extracted_contents
+
+    @pytest.mark.asyncio
+    async def test_pool_is_started_on_first_use(self, orchestrator, source):
+        """Test no worker processes exist until pool processing is requested."""
+        assert orchestrator._proc_pool is None
+
+        await orchestrator.process_file_in_pool(source)
+
+        assert orchestrator._proc_pool is not None
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_fails_one_file_and_is_replaced(
+        self, orchestrator, event_bus, source
+    ):
+        """Test a killed worker fails the file and later files use a new pool."""
+        await orchestrator.process_file_in_pool(source)
+        broken_pool = orchestrator._proc_pool
+        for child in multiprocessing.active_children():
+            os.kill(child.pid, signal.SIGKILL)
+            child.join()
+
+        orchestrator.clear_cache()
+        failures = event_bus.subscribe(EventType.PROCESSING_FAILED)
+        failed = await orchestrator.process_file_in_pool(source)
+
+        assert not failed.success
+        assert failed.errors
+        assert failures.qsize() == 1
+
+        recovered = await orchestrator.process_file_in_pool(source)
+
+        assert recovered.success, recovered.errors
+        assert orchestrator._proc_pool is not broken_pool
@@ -0,0 +1,97 @@
+"""Unit tests for the shared per-file scan cache."""
+
+import os
+import pytest
+
+from trapper_keeper.mcp.tools.parse_cache import parse_doc, scan_content
+
+
+class TestScanContent:
+    """Test scan_content helper."""
+
+    def test_collects_metadata_references_and_categories(self):
+        """Test one scan finds frontmatter, links and categories."""
+        content = (
+            "---\ncategory: API\n---\n"
+            "# Endpoints\n\n"
+            "See [setup](setup.md) and [spec][spec] or [site](https://example.com).\n\n"
+            "[spec]: docs/spec.md\n"
+            "Categories: Security, Testing\n"
+        )
+
+        parsed = scan_content(content)
+
+        assert parsed.metadata == {"category": "API", "title": "Endpoints"}
+        assert parsed.references == ("setup.md", "docs/spec.md")
+        assert parsed.categories == ("API", "Security", "Testing")
+        assert parsed.has_structure
+
+    def test_reference_definitions_start_a_line(self):
+        """Test empty and inline definitions do not capture other targets."""
+        content = (
+            "Use [a][a], [b][b] and [c][c].\n\n"
+            "[a]:\n"
+            "[b]: x.md\n"
+            "see [c]: y.md\n"
+        )
+
+        assert scan_content(content).references == ("x.md",)
+
+    def test_non_mapping_frontmatter_is_ignored(self):
+        """Test list frontmatter does not become metadata."""
+        parsed = scan_content("---\n- a\n- b\n---\n# Title\n")
+
+        assert parsed.metadata == {"title": "Title"}
+        assert parsed.categories == ()
+
+    def test_malformed_frontmatter_is_ignored(self):
+        """Test invalid YAML and scalar categories do not fail the scan."""
+        parsed = scan_content("---\ntitle: [unclosed\n---\n# Title\n")
+        assert parsed.metadata == {"title": "Title"}
+
+        # PyYAML raises ValueError rather than YAMLError for impossible dates
+        parsed = scan_content("---\ndate: 2020-13-45\n---\n# Title\nCategory: x\n")
+        assert parsed.metadata == {"title": "Title", "category": "x"}
+        assert parsed.categories == ("x",)
+
+        # The scalar is skipped as frontmatter but still reads as a declaration
+        parsed = scan_content("---\ncategories: 5\n---\n# Title\n")
+        assert parsed.categories == ("5",)
+
+
+class TestParseDoc:
+    """Test parse_doc caching."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        """Start and end each test with an empty cache."""
+        parse_doc.cache_clear()
+        yield
+        parse_doc.cache_clear()
+
+    def test_unchanged_file_is_scanned_once(self, tmp_path):
+        """Test the same stat reuses the cached scan."""
+        path = tmp_path / "doc.md"
+        path.write_text("# Title\n\nCategory: API")
+        stat = path.stat()
+
+        first = parse_doc(str(path), stat.st_mtime_ns, stat.st_size)
+        second = parse_doc(str(path), stat.st_mtime_ns, stat.st_size)
+
+        assert second is first
+        assert parse_doc.cache_info().hits == 1
+
+    def test_modified_file_is_rescanned(self, tmp_path):
+        """Test a new mtime or size gives a fresh scan."""
+        path = tmp_path / "doc.md"
+        path.write_text("# Title\n\nCategory: API")
+        stat = path.stat()
+        first = parse_doc(str(path), stat.st_mtime_ns, stat.st_size)
+
+        path.write_text("# Title\n\nCategory: Database")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        stat = path.stat()
+        second = parse_doc(str(path), stat.st_mtime_ns, stat.st_size)
+
+        assert first.categories == ("API",)
+        assert second.categories == ("Database",)
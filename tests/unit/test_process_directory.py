@@ -0,0 +1,128 @@
+"""Unit tests for the process_directory MCP tool."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from trapper_keeper.core.types import ProcessingResult
+from trapper_keeper.mcp import server as server_module
+from trapper_keeper.mcp.server import ProcessDirectoryRequest, process_directory
+
+
+class RecordingOrchestrator:
+    """Stand-in orchestrator that records the overrides each file was given."""
+
+    def __init__(self, fail_after=None):
+        self.calls = {}
+        self.fail_after = fail_after
+        self.config = SimpleNamespace(model_dump_json=lambda: "{}")
+
+    async def process_file_in_pool(self, path, *, overrides=None, config_json=None):
+        if self.fail_after is not None and len(self.calls) >= self.fail_after:
+            raise RuntimeError("worker died")
+        self.calls[path] = overrides
+        # Yield so concurrent calls interleave
+        await asyncio.sleep(0)
+        return ProcessingResult(document_id=path.stem, success=True)
+
+
+@pytest.fixture
+def install_server(monkeypatch):
+    """Install a minimal server around the given orchestrator."""
+    def install(orchestrator, max_concurrent=2):
+        server = SimpleNamespace(
+            config=SimpleNamespace(max_concurrent_processing=max_concurrent),
+            orchestrator=orchestrator,
+            organizer=SimpleNamespace(organize_batch=lambda contents, organized: None),
+        )
+        monkeypatch.setattr(server_module, "_server", server)
+        return server
+    return install
+
+
+@pytest.fixture
+def fake_walk(monkeypatch, tmp_path):
+    """Replace the directory walk with generated paths, recording when it ends."""
+    finished = threading.Event()
+
+    def iter_matching_files(directory, patterns, recursive=True):
+        try:
+            for i in range(int(directory.name.rsplit("-", 1)[1])):
+                yield directory / f"file{i}.md"
+        finally:
+            finished.set()
+
+    monkeypatch.setattr(server_module, "iter_matching_files", iter_matching_files)
+    return finished
+
+
+class TestProcessDirectory:
+    """Test process_directory queueing and per-request state."""
+
+    @pytest.mark.asyncio
+    async def test_processes_every_discovered_file(self, tmp_path, install_server, fake_walk):
+        """Test more files than the queue holds are all processed once."""
+        orchestrator = RecordingOrchestrator()
+        install_server(orchestrator)
+
+        results = await process_directory(
+            ProcessDirectoryRequest(directory_path=str(tmp_path / "docs-700"))
+        )
+
+        assert len(results) == 700
+        assert len(orchestrator.calls) == 700
+        assert all(result.success for result in results.values())
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(30)
+    async def test_worker_failure_releases_discovery_thread(
+        self, tmp_path, install_server, fake_walk
+    ):
+        """Test a failing worker ends the call without leaving the walk blocked."""
+        install_server(RecordingOrchestrator(fail_after=10))
+
+        with pytest.raises(RuntimeError, match="worker died"):
+            await process_directory(
+                ProcessDirectoryRequest(directory_path=str(tmp_path / "docs-400"))
+            )
+
+        # The queue holds 256 paths, so the walk was blocked on a full queue
+        assert await asyncio.get_running_loop().run_in_executor(None, fake_walk.wait, 5)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_keep_their_own_overrides(
+        self, tmp_path, install_server, fake_walk
+    ):
+        """Test two overlapping calls each apply only their own request settings."""
+        orchestrator = RecordingOrchestrator()
+        install_server(orchestrator)
+        first_dir = tmp_path / "first-50"
+        second_dir = tmp_path / "second-50"
+
+        first, second = await asyncio.gather(
+            process_directory(ProcessDirectoryRequest(
+                directory_path=str(first_dir),
+                extract_categories=["🌐 API"],
+                output_dir=str(tmp_path / "out-a"),
+                output_format="json",
+            )),
+            process_directory(ProcessDirectoryRequest(
+                directory_path=str(second_dir),
+                output_dir=str(tmp_path / "out-b"),
+            )),
+        )
+
+        assert len(first) == len(second) == 50
+        assert all(path.startswith(str(first_dir)) for path in first)
+        assert all(path.startswith(str(second_dir)) for path in second)
+        for path, overrides in orchestrator.calls.items():
+            if path.parent == first_dir:
+                assert overrides.extract_categories == ("🌐 API",)
+                assert overrides.output_dir == tmp_path / "out-a"
+                assert overrides.output_format == "json"
+            else:
+                assert overrides.extract_categories is None
+                assert overrides.output_dir == tmp_path / "out-b"
+                assert overrides.output_format == "markdown"
@@ -0,0 +1,67 @@
+"""Unit tests for the reference generator."""
+
+from pathlib import Path
+
+import pytest
+
+from trapper_keeper.core.types import ExtractedContent
+from trapper_keeper.extractor.reference_generator import ReferenceGenerator
+
+
+def _line_based_insert(source: str, link_section: str) -> str:
+    """Insert links the way the original line-splitting implementation did."""
+    lines = source.split('\n')
+    insert_index = 0
+    if lines and lines[0].strip() == '---':
+        for i, line in enumerate(lines[1:], 1):
+            if line.strip() == '---':
+                insert_index = i + 1
+                break
+    lines[insert_index:insert_index] = link_section.split('\n')
+    return '\n'.join(lines)
+
+
+class TestUpdateSourceWithExtractionLinks:
+    """Test update_source_with_extraction_links."""
+
+    @pytest.fixture
+    def extractions(self, tmp_path):
+        """Create one extraction and its output path."""
+        content = ExtractedContent(
+            id="extract-1",
+            document_id="doc",
+            category="Architecture",
+            title="Overview",
+            content="Body",
+        )
+        return [(content, tmp_path / "out" / "overview.md")]
+
+    @pytest.fixture
+    def link_section(self, tmp_path, extractions):
+        """Render the link section for a source without frontmatter."""
+        source = tmp_path / "plain.md"
+        source.write_text("body", encoding='utf-8')
+        updated = ReferenceGenerator().update_source_with_extraction_links(source, extractions)
+        return updated[:-len("\nbody")]
+
+    @pytest.mark.parametrize("source", [
+        "# Title\nbody\n",
+        "---\ntitle: x\n---\n# Title\n",
+        "---\r\ntitle: x\r\n---\r\n# Title\r\n",
+        "--- \ntitle: x\n---  \nbody",
+        "---\ntitle: x\n---\n",
+        "---\ntitle: x\n---",
+        "---\ntitle: x\nno closing fence\n",
+        "---",
+        "",
+    ])
+    def test_matches_line_based_insertion(self, tmp_path, extractions, link_section, source):
+        """Test links land where the line-based implementation put them."""
+        path = tmp_path / "source.md"
+        path.write_bytes(source.encode('utf-8'))
+
+        updated = ReferenceGenerator().update_source_with_extraction_links(path, extractions)
+
+        # Compare with the text as read, since read_text translates CRLF
+        expected = _line_based_insert(path.read_text(encoding='utf-8'), link_section)
+        assert updated == expected